@@ -6,12 +6,138 @@ used by the rest of the application to run Cypher queries.
 """
 
 from __future__ import annotations
+import atexit
+import copy
 import os
-from functools import lru_cache
-from typing import Any, Dict, List, Optional
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, wraps
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Optional, Tuple, TypeVar
 
-from neo4j import GraphDatabase, Driver, Session
-from neo4j.exceptions import Neo4jError
+from cachetools import TTLCache
+
+from neo4j import (
+    READ_ACCESS,
+    Driver,
+    GraphDatabase,
+    Session,
+)
+from neo4j import unit_of_work
+from neo4j.exceptions import Neo4jError, ServiceUnavailable, SessionExpired, TransientError
+
+
+_T = TypeVar("_T")
+
+# Serializes the first call of every process-wide singleton; reentrant because
+# the client factory builds the driver from inside its own first call.
+_SINGLETON_LOCK = threading.RLock()
+
+
+def singleton(factory: Callable[[], _T]) -> Callable[[], _T]:
+    """
+    Cache the result of a zero-argument factory for the life of the process.
+
+    Like lru_cache(maxsize=1), but the first call holds a lock so concurrent
+    first requests cannot each build their own instance (and connection
+    pool). Later calls take the lock-free cached path. cache_info() and
+    cache_clear() are passed through.
+    """
+    cached = lru_cache(maxsize=1)(factory)
+
+    @wraps(factory)
+    def wrapper() -> _T:
+        if cached.cache_info().currsize:
+            return cached()
+        with _SINGLETON_LOCK:
+            return cached()
+
+    wrapper.cache_info = cached.cache_info  # type: ignore[attr-defined]
+    wrapper.cache_clear = cached.cache_clear  # type: ignore[attr-defined]
+    return wrapper
+
+
+class Neo4jUnavailableError(RuntimeError):
+    """Raised when a query fails for a transient reason and can be retried later."""
+
+
+# Errors that mean "Neo4j is temporarily unreachable or overloaded"; managed
+# transactions have already retried the driver ones before they surface.
+NEO4J_UNAVAILABLE_ERRORS = (
+    Neo4jUnavailableError,
+    ServiceUnavailable,
+    SessionExpired,
+    TransientError,
+)
+
+
+def _pool_settings() -> Dict[str, Any]:
+    """
+    Read connection-pool tuning from the environment.
+
+    Env vars (with defaults):
+        NEO4J_POOL_SIZE      max connections kept in the pool (50)
+        NEO4J_ACQ_TIMEOUT    seconds to wait for a free connection (30)
+        NEO4J_CONN_LIFETIME  seconds before a pooled connection is recycled (3600)
+        NEO4J_CONN_TIMEOUT   seconds to establish a new TCP connection (15)
+
+    Returns:
+        Keyword arguments for GraphDatabase.driver.
+    """
+    return {
+        "max_connection_pool_size": int(os.getenv("NEO4J_POOL_SIZE", "50")),
+        "connection_acquisition_timeout": float(os.getenv("NEO4J_ACQ_TIMEOUT", "30")),
+        "max_connection_lifetime": float(os.getenv("NEO4J_CONN_LIFETIME", "3600")),
+        "connection_timeout": float(os.getenv("NEO4J_CONN_TIMEOUT", "15")),
+    }
+
+
+def query_timeout() -> float:
+    """
+    Server-side time limit for request-path queries, in seconds.
+
+    Read from NEO4J_QUERY_TIMEOUT (default 10).
+
+    Returns:
+        Timeout in seconds.
+    """
+    return float(os.getenv("NEO4J_QUERY_TIMEOUT", "10"))
+
+
+def timed_work(name: str, work: Callable[..., _T]) -> Callable[..., _T]:
+    """
+    Tag a transaction function with a query name and the request-path timeout.
+
+    The timeout is read on every call, so a changed NEO4J_QUERY_TIMEOUT takes
+    effect without a restart.
+
+    Args:
+        name: Name reported in the query metadata (SHOW TRANSACTIONS, query log).
+        work: Transaction function to pass to execute_read/execute_write.
+
+    Returns:
+        The wrapped transaction function.
+    """
+    return unit_of_work(metadata={"query": name}, timeout=query_timeout())(work)
+
+
+def _freeze(value: Any) -> Hashable:
+    """
+    Turn a query parameter value into something hashable for cache keys.
+
+    Args:
+        value: Parameter value (scalars, lists, sets or dicts, possibly nested).
+
+    Returns:
+        A hashable equivalent of the value.
+    """
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(v) for v in value)
+    return value
 
 
 class Neo4jClient:
@@ -23,34 +149,44 @@ class Neo4jClient:
         records = client.query("MATCH (n) RETURN n LIMIT 5")
     """
 
-    def __init__(
-        self,
-        uri: str,
-        user: str,
-        password: str,
-        database: Optional[str] = None,
-    ) -> None:
+    def __init__(self, driver: Driver, database: Optional[str] = None) -> None:
         """
-        Initialize the Neo4j driver.
+        Wrap an existing Neo4j driver.
+
+        The driver (and its connection pool) is owned by get_neo4j_driver and
+        shared with code that needs raw sessions, so the client never builds
+        one of its own.
 
         Args:
-            uri: Bolt URI of the Neo4j instance.
-            user: Username for authentication.
-            password: Password for authentication.
+            driver: Shared Neo4j driver instance.
             database: Optional database name (Neo4j 4+).
         """
-        self._uri: str = uri
-        self._user: str = user
-        self._password: str = password
+        self._driver: Driver = driver
         self._database: Optional[str] = database
 
-        self._driver: Driver = GraphDatabase.driver(
-            self._uri,
-            auth=(self._user, self._password),
+        # Read-only results are cached briefly: curriculum data changes rarely
+        # and the same Cypher/parameter pairs are requested over and over.
+        self._cache: TTLCache = TTLCache(
+            maxsize=int(os.getenv("NEO4J_QUERY_CACHE_SIZE", "1024")),
+            ttl=float(os.getenv("NEO4J_QUERY_CACHE_TTL", "60")),
         )
+        self._cache_lock = threading.Lock()
+
+        # query() reuses one session per worker thread instead of opening a
+        # new one for every statement; every session is tracked so it can be
+        # closed on shutdown.
+        self._tls = threading.local()
+        self._sessions: List[Session] = []
+        self._sessions_lock = threading.Lock()
+
+    def invalidate(self) -> None:
+        """Drop every cached read-only query result."""
+        with self._cache_lock:
+            self._cache.clear()
 
     def close(self) -> None:
-        """Close the underlying driver."""
+        """Close the per-thread sessions and the underlying (shared) driver."""
+        self.close_sessions()
         if self._driver is not None:
             self._driver.close()
 
@@ -70,14 +206,40 @@ class Neo4jClient:
 
     def _get_session(self) -> Session:
         """
-        Create a new session.
+        Return the calling thread's session, creating it on first use.
+
+        Sessions are not thread-safe, so each thread gets its own. Each
+        query() call runs as one standalone managed transaction, so sharing
+        the session between calls on the same thread is safe.
 
         Returns:
             A Neo4j session bound to the configured database (if any).
         """
-        if self._database:
-            return self._driver.session(database=self._database)
-        return self._driver.session()
+        session = getattr(self._tls, "session", None)
+        if session is None or session.closed():
+            session = self.session()
+            self._tls.session = session
+            with self._sessions_lock:
+                self._sessions.append(session)
+        return session
+
+    def _discard_session(self) -> None:
+        """Close and forget the calling thread's session (e.g., after an error)."""
+        session = getattr(self._tls, "session", None)
+        if session is None:
+            return
+        self._tls.session = None
+        with self._sessions_lock:
+            if session in self._sessions:
+                self._sessions.remove(session)
+        session.close()
+
+    def close_sessions(self) -> None:
+        """Close every per-thread session opened by query()."""
+        with self._sessions_lock:
+            sessions, self._sessions = self._sessions, []
+        for session in sessions:
+            session.close()
 
     def query(
         self,
@@ -88,6 +250,9 @@ class Neo4jClient:
         """
         Execute a Cypher query and return the results as a list of dicts.
 
+        Read-only results are served from a TTL cache keyed on the query text
+        and parameters. Write queries bypass the cache and invalidate it.
+
         Args:
             cypher: The Cypher query string.
             parameters: Optional dictionary of query parameters.
@@ -97,59 +262,189 @@ class Neo4jClient:
             List of records as dictionaries.
 
         Raises:
-            Neo4jError: If the query execution fails.
+            Neo4jUnavailableError: If Neo4j is unreachable or the query kept
+                failing with a transient error.
+            RuntimeError: If the query execution fails otherwise.
         """
         parameters = parameters or {}
 
+        if read_only:
+            key = (cypher, _freeze(parameters))
+            with self._cache_lock:
+                cached = self._cache.get(key)
+            if cached is not None:
+                return copy.deepcopy(cached)
+
+        @unit_of_work(timeout=query_timeout())
+        def _work(tx):
+            # Result.data() converts every record to a dict inside the driver
+            return tx.run(cypher, parameters).data()
+
+        session = self._get_session()
         try:
-            with self._get_session() as session:
-                if read_only:
-                    result = session.execute_read(lambda tx: list(tx.run(cypher, **parameters)))
-                else:
-                    result = session.execute_write(lambda tx: list(tx.run(cypher, **parameters)))
+            if read_only:
+                rows = session.execute_read(_work)
+            else:
+                rows = session.execute_write(_work)
 
-            # Convert records to plain dicts
-            return [record.data() for record in result]
+        except NEO4J_UNAVAILABLE_ERRORS as exc:
+            self._discard_session()
+            raise Neo4jUnavailableError(f"Neo4j temporarily unavailable: {exc}") from exc
 
         except Neo4jError as exc:
             # You can improve logging later
+            self._discard_session()
+            raise RuntimeError(f"Neo4j query failed: {exc}") from exc
+
+        except Exception:
+            self._discard_session()
+            raise
+
+        if read_only:
+            with self._cache_lock:
+                self._cache[key] = copy.deepcopy(rows)
+        else:
+            self.invalidate()
+
+        return rows
+
+    def stream_query(
+        self,
+        cypher: str,
+        parameters: Optional[Dict[str, Any]] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Execute a read-only Cypher query and yield records one at a time.
+
+        Unlike query(), records are pulled from the server as the caller
+        consumes them, so large results never sit in memory as a whole.
+        Results are not cached. The session stays open until the iterator
+        is exhausted or closed.
+
+        Args:
+            cypher: The Cypher query string.
+            parameters: Optional dictionary of query parameters.
+
+        Yields:
+            Each record as a dictionary.
+
+        Raises:
+            Neo4jUnavailableError: If Neo4j is unreachable or the query hit a
+                transient error.
+            RuntimeError: If the query execution fails otherwise.
+        """
+        parameters = parameters or {}
+
+        try:
+            with self.session(default_access_mode=READ_ACCESS) as session:
+                for record in session.run(cypher, parameters):
+                    yield record.data()
+
+        except NEO4J_UNAVAILABLE_ERRORS as exc:
+            raise Neo4jUnavailableError(f"Neo4j temporarily unavailable: {exc}") from exc
+
+        except Neo4jError as exc:
             raise RuntimeError(f"Neo4j query failed: {exc}") from exc
 
 
-@lru_cache(maxsize=1)
+def get_neo4j_database() -> str:
+    """
+    Name of the database every session should target.
+
+    Naming it explicitly spares the driver a home-database lookup each time
+    a session is opened. Read from NEO4J_DATABASE (default "neo4j").
+    """
+    return os.getenv("NEO4J_DATABASE", "neo4j")
+
+
+@singleton
 def get_neo4j_client() -> Neo4jClient:
     """
     Factory for a singleton Neo4jClient.
 
-    Values are read from environment variables:
-        NEO4J_URI
-        NEO4J_USER
-        NEO4J_PASSWORD
-        NEO4J_DATABASE
+    The client wraps the driver returned by get_neo4j_driver, so the whole
+    process shares a single connection pool. The target database is read
+    from get_neo4j_database.
 
     Returns:
         A cached Neo4jClient instance.
     """
-    uri = os.getenv("NEO4J_URI", "bolt://localhost:7687")
-    user = os.getenv("NEO4J_USER", "neo4j")
-    password = os.getenv("NEO4J_PASSWORD", "password")
-    database = os.getenv("NEO4J_DATABASE", "neo4j")
+    return Neo4jClient(driver=get_neo4j_driver(), database=get_neo4j_database())
+
+
+@singleton
+def get_read_executor() -> ThreadPoolExecutor:
+    """
+    Shared thread pool for running independent read queries side by side.
 
-    return Neo4jClient(uri=uri, user=user, password=password, database=database)
+    The driver releases the GIL during network I/O, so two reads submitted
+    here overlap. Workers are long-lived and each keeps its own thread-local
+    client session, so the pool size also bounds those sessions.
+
+    Returns:
+        A cached ThreadPoolExecutor.
+    """
+    return ThreadPoolExecutor(max_workers=8, thread_name_prefix="neo4j-read")
+
+
+def warm_page_cache() -> bool:
+    """
+    Read the curriculum graph once so Neo4j loads it into its page cache.
+
+    Touches every Course and Student with their PRE_REQUIRES, OFFERED_IN and
+    HAS_COMPLETED relationships, so the first real requests read from memory
+    instead of faulting pages in from disk. Plain Cypher is used because
+    APOC is not installed everywhere. Intended to run once, off the request
+    path, at application startup.
+
+    Returns:
+        True if the warm-up query ran, False if Neo4j could not be reached.
+    """
+    query = """
+    CALL {
+        MATCH (c:Course)
+        OPTIONAL MATCH (c)-[r:PRE_REQUIRES|OFFERED_IN]->()
+        RETURN count(c.code) + count(r) AS courses
+    }
+    CALL {
+        MATCH (s:Student)
+        OPTIONAL MATCH (s)-[r:HAS_COMPLETED]->()
+        RETURN count(s.student_id) + count(r) AS students
+    }
+    RETURN courses + students AS touched
+    """
+    try:
+        with get_neo4j_client().session(default_access_mode=READ_ACCESS) as session:
+            session.run(query).consume()
+    except (Neo4jError, *NEO4J_UNAVAILABLE_ERRORS):
+        return False
+    return True
+
+
+def close_neo4j_sessions() -> None:
+    """
+    Close the singleton client's per-thread sessions, if it was ever created.
+
+    Intended for application shutdown.
+    """
+    if get_neo4j_client.cache_info().currsize:
+        get_neo4j_client().close_sessions()
 
 
-@lru_cache(maxsize=1)
+@singleton
 def get_neo4j_driver() -> Driver:
     """
-    Factory for a singleton Neo4j Driver.
+    Factory for the process-wide Neo4j Driver.
 
-    This function provides direct access to the Neo4j driver for services
-    that need to use sessions directly (e.g., for GDS operations).
+    This is the only place a sync driver is built: Neo4jClient wraps it and
+    services that need sessions directly (e.g., for GDS operations) use it
+    as-is. The driver is closed automatically at interpreter exit.
 
     Values are read from environment variables:
         NEO4J_URI
         NEO4J_USER
         NEO4J_PASSWORD
+        plus the pool settings documented in _pool_settings.
 
     Returns:
         A cached Neo4j Driver instance.
@@ -158,4 +453,40 @@ def get_neo4j_driver() -> Driver:
     user = os.getenv("NEO4J_USER", "neo4j")
     password = os.getenv("NEO4J_PASSWORD", "password")
 
-    return GraphDatabase.driver(uri, auth=(user, password))
+    driver = GraphDatabase.driver(uri, auth=(user, password), **_pool_settings())
+    atexit.register(driver.close)
+    return driver
+
+
+@singleton
+def get_server_version() -> Tuple[int, ...]:
+    """
+    Version of the connected Neo4j server, checked once per process.
+
+    Used to gate Cypher features that only exist on newer servers.
+
+    Returns:
+        Version numbers parsed from the server agent, e.g. (5, 21, 0).
+    """
+    agent = get_neo4j_driver().get_server_info().agent  # e.g. "Neo4j/5.21.0"
+    version = agent.split("/", 1)[-1]
+    return tuple(int(part) for part in re.findall(r"\d+", version)[:3])
+
+
+def in_transactions_clause(batch_size: int = 100) -> str:
+    """
+    Batching suffix for a CALL { ... } subquery in a bulk write job.
+
+    Uses IN CONCURRENT TRANSACTIONS on servers that support it (Neo4j 5.21+)
+    and the sequential form otherwise. Only use it for jobs whose batches
+    write disjoint nodes.
+
+    Args:
+        batch_size: Rows committed per inner transaction.
+
+    Returns:
+        The clause to append after the subquery's closing brace.
+    """
+    if get_server_version() >= (5, 21):
+        return f"IN CONCURRENT TRANSACTIONS OF {int(batch_size)} ROWS"
+    return f"IN TRANSACTIONS OF {int(batch_size)} ROWS"
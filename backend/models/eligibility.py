@@ -16,3 +16,9 @@ class EligibilityResponse(BaseModel):
     course_id: str
     eligible: bool
     missing_prerequisites: List[str]
+
+
+class EligibilityBatchRequest(BaseModel):
+    """Request model for checking eligibility for several courses at once."""
+
+    course_ids: List[str]
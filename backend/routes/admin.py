@@ -0,0 +1,71 @@
+"""
+Admin API Routes
+
+Maintenance endpoints for refreshing precomputed curriculum data.
+"""
+
+from typing import Dict, Union
+
+from fastapi import APIRouter
+
+from backend.database.neo4j import get_neo4j_client
+from backend.services import prerequisites as prereq_service
+from backend.services.degree_planner_service import get_degree_requirements
+from backend.services.advanced_queries_service import get_moderate_queries_service
+
+router = APIRouter(prefix="/admin", tags=["Admin"])
+
+
+@router.post("/prerequisites/rebuild")
+def rebuild_prerequisites() -> Dict[str, Union[str, int, bool]]:
+    """
+    Recompute the materialized prerequisite data on every Course node.
+
+    Refreshes the transitive prerequisite closure, the in-memory
+    prerequisite table and the bottleneck metrics. Call this after importing
+    or editing PRE_REQUIRES relationships.
+
+    Returns:
+        Dictionary with status, number of properties written and whether the
+        rebuilt graph contains a prerequisite cycle.
+    """
+    properties_set = prereq_service.materialize_prerequisite_closure()
+    properties_set += get_moderate_queries_service().materialize_bottleneck_metrics()
+    return {
+        "status": "ok",
+        "properties_set": properties_set,
+        "has_cycles": prereq_service.has_cycles(),
+    }
+
+
+@router.post("/cache/clear")
+def clear_caches() -> Dict[str, str]:
+    """
+    Drop cached degree requirements, course recommendations and query
+    results, and reload the in-memory prerequisite table.
+
+    Call this after editing the curriculum graph outside of the rebuild
+    endpoint (e.g., re-running the seed scripts).
+
+    Returns:
+        Dictionary with status.
+    """
+    get_degree_requirements.cache_clear()
+    get_moderate_queries_service().invalidate()
+    get_neo4j_client().invalidate()
+    prereq_service.load_prerequisite_table()
+    return {"status": "ok"}
+
+
+@router.post("/refresh")
+def refresh_prerequisite_table() -> Dict[str, Union[str, int, bool]]:
+    """
+    Rebuild the in-memory prerequisite table used for eligibility checks
+    and cycle detection.
+
+    Returns:
+        Dictionary with status, number of courses loaded and whether the
+        graph contains a prerequisite cycle.
+    """
+    courses = prereq_service.load_prerequisite_table()
+    return {"status": "ok", "courses": courses, "has_cycles": prereq_service.has_cycles()}
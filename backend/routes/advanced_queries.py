@@ -4,6 +4,7 @@ Exposes complex Cypher query patterns via REST API
 """
 
 from fastapi import APIRouter, HTTPException, Query
+from backend.database.neo4j import NEO4J_UNAVAILABLE_ERRORS
 from backend.services.advanced_queries_service import get_moderate_queries_service
 
 router = APIRouter(prefix="/api/advanced", tags=["Advanced Queries"])
@@ -24,12 +25,12 @@ router = APIRouter(prefix="/api/advanced", tags=["Advanced Queries"])
     
     **Advanced Cypher patterns:**
     - OPTIONAL MATCH with multiple patterns
-    - Variable-length paths: [:PRE_REQUIRES*1..3]
+    - Quantified path pattern: (()-[:PRE_REQUIRES]->()){1,3}
     - Multiple WITH clauses for data transformation
     - Collection and aggregation functions
     """,
 )
-async def find_bottleneck_courses(
+def find_bottleneck_courses(
     min_dependents: int = Query(
         3, ge=1, le=20, description="Minimum number of courses this must unlock"
     ),
@@ -54,6 +55,10 @@ async def find_bottleneck_courses(
             "filters": {"min_dependents": min_dependents, "min_prerequisites": min_prerequisites},
         }
 
+    except NEO4J_UNAVAILABLE_ERRORS:
+        # answered with 503 + Retry-After by the app-level handler
+        raise
+
     except Exception as exc:
         raise HTTPException(
             status_code=500, detail=f"Error finding bottleneck courses: {str(exc)}"
@@ -77,9 +82,14 @@ async def find_bottleneck_courses(
     - List comprehension with WHERE filtering
     - Complex CASE expressions for scoring
     - Computed metrics and filtering
+
+    **Caching:** results are cached briefly per parameter set. `min_readiness`
+    is rounded down to a multiple of 5 and `limit` up to a multiple of 5
+    before the lookup, so nearby requests share one cache entry; the response
+    is then trimmed back to the exact values requested.
     """,
 )
-async def get_course_recommendations(
+def get_course_recommendations(
     student_id: str,
     semester_id: str = Query(
         "FALL_2024", description="Target semester ID (e.g., 'FALL_2024', 'SPRING_2025')"
@@ -96,11 +106,26 @@ async def get_course_recommendations(
     try:
         service = get_moderate_queries_service()
         result = service.get_course_recommendations(
-            student_id=student_id, semester_id=semester_id, min_readiness=min_readiness, limit=limit
+            student_id=student_id,
+            semester_id=semester_id,
+            min_readiness=(min_readiness // 5) * 5,
+            limit=((limit + 4) // 5) * 5,
         )
 
+        courses = [
+            course
+            for course in result["recommendations"]
+            if course["readiness_score"] >= min_readiness
+        ][:limit]
+        result["recommendations"] = courses
+        result["total_recommendations"] = len(courses)
+
         return result
 
+    except NEO4J_UNAVAILABLE_ERRORS:
+        # answered with 503 + Retry-After by the app-level handler
+        raise
+
     except Exception as exc:
         raise HTTPException(
             status_code=500, detail=f"Error getting recommendations: {str(exc)}"
@@ -129,7 +154,7 @@ async def get_course_recommendations(
     - CASE expressions for categorization
     """,
 )
-async def get_courses_by_depth(
+def get_courses_by_depth(
     student_id: str, limit: int = Query(20, ge=1, le=100, description="Maximum courses to return")
 ):
     """
@@ -144,6 +169,10 @@ async def get_courses_by_depth(
 
         return result
 
+    except NEO4J_UNAVAILABLE_ERRORS:
+        # answered with 503 + Retry-After by the app-level handler
+        raise
+
     except Exception as exc:
         raise HTTPException(
             status_code=500, detail=f"Error analyzing course depth: {str(exc)}"
@@ -162,7 +191,7 @@ async def get_courses_by_depth(
     - Overall progress metrics
     """,
 )
-async def get_student_summary(
+def get_student_summary(
     student_id: str, semester_id: str = Query("FALL_2024", description="Target semester")
 ):
     """
@@ -174,13 +203,12 @@ async def get_student_summary(
     try:
         service = get_moderate_queries_service()
 
-        # Get recommendations
-        recommendations = service.get_course_recommendations(
-            student_id=student_id, semester_id=semester_id, min_readiness=75, limit=10
+        # Recommendations and course depth analysis in one transaction
+        bundle = service.get_student_summary_bundle(
+            student_id=student_id, semester_id=semester_id
         )
-
-        # Get course depth analysis
-        depth_analysis = service.get_courses_by_prerequisite_depth(student_id=student_id, limit=20)
+        recommendations = bundle["recommendations"]
+        depth_analysis = bundle["depth"]
 
         return {
             "student_id": student_id,
@@ -198,6 +226,10 @@ async def get_student_summary(
             },
         }
 
+    except NEO4J_UNAVAILABLE_ERRORS:
+        # answered with 503 + Retry-After by the app-level handler
+        raise
+
     except Exception as exc:
         raise HTTPException(
             status_code=500, detail=f"Error generating student summary: {str(exc)}"
@@ -4,20 +4,19 @@ Eligibility API Routes
 Endpoints for checking student eligibility for courses based on completed prerequisites.
 """
 
+from typing import List
+
 from fastapi import APIRouter, Query
 
-from backend.models.eligibility import EligibilityResponse
+from backend.models.eligibility import EligibilityBatchRequest, EligibilityResponse
 from backend.services import prerequisites as prereq_service
-from backend.services.eligibility_service import EligibilityService
+from backend.services.eligibility_service import create_eligibility_response
 
 router = APIRouter(
     prefix="/api/students",
     tags=["eligibility"],
 )
 
-# Create one shared instance of the service
-eligibility_service = EligibilityService()
-
 
 @router.get("/{student_id}/eligibility", response_model=EligibilityResponse)
 def check_eligibility(
@@ -33,14 +32,32 @@ def check_eligibility(
     Returns:
         EligibilityResponse containing eligibility status and missing prerequisites.
     """
-    # Get completed courses from the instance
-    completed_courses = eligibility_service.get_completed_courses(student_id)
+    # Required prerequisites come from the in-memory table; only the
+    # student's completed courses are read from Neo4j
+    missing = prereq_service.check_student_can_take(student_id, course_id)["missing"]
+
+    # Build the response
+    return create_eligibility_response(student_id, course_id, missing)
 
-    # Get prerequisites using prerequisite service
-    course_prereqs = prereq_service.get_all_prerequisites(course_id)
 
-    # Compute missing prerequisites
-    missing = eligibility_service.compute_missing_prerequisites(course_prereqs, completed_courses)
+@router.post("/{student_id}/eligibility/batch", response_model=List[EligibilityResponse])
+def check_eligibility_batch(
+    student_id: str, payload: EligibilityBatchRequest
+) -> List[EligibilityResponse]:
+    """
+    Check a student's eligibility for several courses in one request.
 
-    # Build the response
-    return eligibility_service.create_eligibility_response(student_id, course_id, missing)
+    Args:
+        student_id: The student ID to check eligibility for.
+        payload: EligibilityBatchRequest listing the course codes to check.
+
+    Returns:
+        One EligibilityResponse per requested course, in request order.
+    """
+    # Same check as /can_take: in-memory table plus one completed-courses query
+    checks = prereq_service.check_student_can_take_batch(student_id, payload.course_ids)
+
+    return [
+        create_eligibility_response(student_id, check["course"], check["missing"])
+        for check in checks
+    ]
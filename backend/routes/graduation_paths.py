@@ -4,22 +4,34 @@ Graduation Paths API Routes
 Endpoints for generating all possible graduation paths for students.
 """
 
-from typing import Dict
+from typing import Dict, Iterator, Optional
 
-from fastapi import APIRouter, HTTPException
+import orjson
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
 
-from backend.services.graduation_paths_service import generate_graduation_paths
+from backend.database.neo4j import NEO4J_UNAVAILABLE_ERRORS
+from backend.services.graduation_paths_service import (
+    generate_graduation_paths,
+    stream_graduation_paths,
+)
 
 router = APIRouter(prefix="/api/students", tags=["Graduation Paths"])
 
 
 @router.get("/{student_id}/paths/graduation")
-async def get_graduation_paths(student_id: str) -> Dict:
+def get_graduation_paths(
+    student_id: str,
+    max_paths: int = Query(
+        50, ge=1, description="Maximum number of paths to return"
+    ),
+) -> Dict:
     """
     Get all possible graduation paths for a student.
 
     Args:
         student_id: The student ID to generate paths for.
+        max_paths: Maximum number of paths to return.
 
     Returns:
         Dictionary containing all valid course orderings for graduation.
@@ -28,6 +40,50 @@ async def get_graduation_paths(student_id: str) -> Dict:
         HTTPException: 500 if an error occurs during path generation.
     """
     try:
-        return generate_graduation_paths(student_id)
+        return generate_graduation_paths(student_id, max_paths)
+    except NEO4J_UNAVAILABLE_ERRORS:
+        # answered with 503 + Retry-After by the app-level handler
+        raise
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc)) from exc
+
+
+@router.get("/{student_id}/paths/graduation/stream")
+def stream_graduation_paths_ndjson(
+    student_id: str,
+    max_paths: Optional[int] = Query(
+        None, ge=1, description="Stop after this many paths (default: all)"
+    ),
+) -> StreamingResponse:
+    """
+    Stream graduation paths for a student as NDJSON, one ordering per line.
+
+    Orderings are written as they are enumerated, so memory stays flat and
+    the first path arrives without waiting for the full enumeration.
+
+    Args:
+        student_id: The student ID to generate paths for.
+        max_paths: Stop after this many paths.
+
+    Returns:
+        StreamingResponse emitting one JSON array of course codes per line.
+
+    Raises:
+        HTTPException: 404 if the student is not found, 500 on other errors.
+    """
+    try:
+        paths = stream_graduation_paths(student_id, max_paths)
+    except NEO4J_UNAVAILABLE_ERRORS:
+        # answered with 503 + Retry-After by the app-level handler
+        raise
+    except Exception as exc:
+        raise HTTPException(status_code=500, detail=str(exc)) from exc
+
+    if paths is None:
+        raise HTTPException(status_code=404, detail="Student not found")
+
+    def lines() -> Iterator[bytes]:
+        for path in paths:
+            yield orjson.dumps(path) + b"\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
@@ -3,7 +3,7 @@ Schedule Optimization API Routes
 """
 
 from fastapi import APIRouter, HTTPException, Query
-from backend.database.neo4j import get_neo4j_driver
+from backend.database.neo4j import NEO4J_UNAVAILABLE_ERRORS, get_neo4j_client
 from backend.models.schedule import OptimizedScheduleResponse, ScheduleConstraints
 from backend.services.schedule_optimizer_service import get_schedule_optimizer_service
 
@@ -25,7 +25,7 @@ router = APIRouter(prefix="/api/students", tags=["Schedule Optimization"])
     and distributes courses across semesters to avoid overload.
     """,
 )
-async def optimize_schedule(
+def optimize_schedule(
     student_id: str,
     max_courses_per_semester: int = Query(
         5, ge=1, le=8, description="Maximum number of courses per semester"
@@ -61,6 +61,10 @@ async def optimize_schedule(
 
         return result
 
+    except NEO4J_UNAVAILABLE_ERRORS:
+        # answered with 503 + Retry-After by the app-level handler
+        raise
+
     except Exception as exc:
         raise HTTPException(
             status_code=500, detail=f"Error optimizing schedule: {str(exc)}"
@@ -72,7 +76,7 @@ async def optimize_schedule(
     summary="Get available semesters for scheduling",
     description="Get list of available semesters with course offerings",
 )
-async def get_available_semesters(
+def get_available_semesters(
     student_id: str,
     start_semester: str = Query("FALL_2024", description="Starting semester"),
     limit: int = Query(8, ge=1, le=20, description="Number of semesters to return"),
@@ -80,41 +84,36 @@ async def get_available_semesters(
     """
     Get available semesters for a student
 
+    Semester listings change only when offerings are reseeded, so results
+    come from the client's read cache (flushed by POST /admin/cache/clear).
+
     Example:
         GET /api/students/S001/schedule/semesters?limit=8
     """
     try:
-        driver = get_neo4j_driver()
-
-        with driver.session() as session:
-            query = """
-            MATCH (s:Semester)
-            WHERE s.id >= $start_semester
-            OPTIONAL MATCH (c:Course)-[:OFFERED_IN]->(s)
-            WITH s, count(c) as course_count
-            RETURN s.id as id,
-                   s.name as name,
-                   s.year as year,
-                   s.term as term,
-                   course_count
-            ORDER BY s.order
-            LIMIT $limit
-            """
-            result = session.run(query, start_semester=start_semester, limit=limit)
-
-            semesters = []
-            for record in result:
-                semesters.append(
-                    {
-                        "id": record["id"],
-                        "name": record["name"],
-                        "year": record["year"],
-                        "term": record["term"],
-                        "courses_offered": record["course_count"],
-                    }
-                )
-
-            return {"student_id": student_id, "semesters": semesters, "total": len(semesters)}
+        query = """
+        MATCH (start:Semester {id: $start_semester})
+        MATCH (s:Semester)
+        WHERE s.order >= start.order
+        OPTIONAL MATCH (c:Course)-[:OFFERED_IN]->(s)
+        WITH s, count(c) as course_count
+        RETURN s.id as id,
+               s.name as name,
+               s.year as year,
+               s.term as term,
+               course_count as courses_offered
+        ORDER BY s.order
+        LIMIT $limit
+        """
+        semesters = get_neo4j_client().query(
+            query, {"start_semester": start_semester, "limit": limit}, read_only=True
+        )
+
+        return {"student_id": student_id, "semesters": semesters, "total": len(semesters)}
+
+    except NEO4J_UNAVAILABLE_ERRORS:
+        # answered with 503 + Retry-After by the app-level handler
+        raise
 
     except Exception as exc:
         raise HTTPException(
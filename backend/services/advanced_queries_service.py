@@ -3,8 +3,218 @@ Moderate Complexity Cypher Queries Service
 Practical queries for school context with advanced patterns
 """
 
+import copy
+import os
+import threading
 from typing import List, Dict, Any
-from backend.database.neo4j import get_neo4j_driver
+
+from cachetools import TTLCache
+from neo4j import Query, Result, RoutingControl
+from backend.database.neo4j import (
+    get_neo4j_database,
+    get_neo4j_driver,
+    in_transactions_clause,
+    query_timeout,
+    singleton,
+    timed_work,
+)
+
+# Cypher statements are module constants so every call sends byte-identical,
+# fully parameterized text and hits Neo4j's query plan cache. Each one is
+# tagged with a name (visible in SHOW TRANSACTIONS and the query log) and the
+# request-path timeout when it runs; statements run inside transaction
+# functions carry those through timed_work, since tx.run only accepts plain
+# strings.
+
+_BOTTLENECK_QUERY = """
+// Find courses that block progress. A bottleneck both requires and is
+// required by another course, so start from courses in the middle of a
+// PRE_REQUIRES chain instead of scanning every Course.
+MATCH (:Course)-[:PRE_REQUIRES]->(bottleneck:Course)-[:PRE_REQUIRES]->(:Course)
+WITH DISTINCT bottleneck
+
+// Use the materialized metrics when present; otherwise count live.
+// Count courses that require this course
+CALL {
+    WITH bottleneck
+    WITH bottleneck WHERE bottleneck.unlocks_count IS NULL
+    OPTIONAL MATCH (dependent:Course)-[:PRE_REQUIRES]->(bottleneck)
+    RETURN count(DISTINCT dependent) as live_unlocks
+}
+// Count prerequisites for this course (depth 1-3)
+CALL {
+    WITH bottleneck
+    WITH bottleneck WHERE bottleneck.prereqs_within_3 IS NULL
+    OPTIONAL MATCH (bottleneck) (()-[:PRE_REQUIRES]->()){1,3} (prereq:Course)
+    RETURN count(DISTINCT prereq) as live_prereqs
+}
+WITH bottleneck,
+     coalesce(bottleneck.unlocks_count, live_unlocks) as courses_this_unlocks,
+     coalesce(bottleneck.prereqs_within_3, live_prereqs) as total_prereqs
+
+// Filter for bottlenecks
+WHERE courses_this_unlocks >= $min_dependents
+  AND total_prereqs >= $min_prerequisites
+
+// Get semester availability
+OPTIONAL MATCH (bottleneck)-[:OFFERED_IN]->(sem:Semester)
+WITH bottleneck,
+     courses_this_unlocks,
+     total_prereqs,
+     collect(DISTINCT sem.name) as offered_semesters
+
+RETURN bottleneck.code as course_code,
+       bottleneck.name as course_name,
+       total_prereqs as prerequisites_needed,
+       courses_this_unlocks as courses_unlocked,
+       size(offered_semesters) as semesters_offered,
+       offered_semesters[0..3] as sample_semesters
+ORDER BY courses_this_unlocks DESC, total_prereqs DESC
+LIMIT $limit
+"""
+
+
+# Writes the request-independent part of the bottleneck metrics onto each
+# Course; the batching clause is appended at run time.
+_BOTTLENECK_METRICS_QUERY = """
+MATCH (c:Course)
+CALL {
+    WITH c
+    OPTIONAL MATCH (dependent:Course)-[:PRE_REQUIRES]->(c)
+    WITH c, count(DISTINCT dependent) as unlocks
+    OPTIONAL MATCH (c) (()-[:PRE_REQUIRES]->()){1,3} (prereq:Course)
+    WITH c, unlocks, count(DISTINCT prereq) as prereqs
+    SET c.unlocks_count = unlocks,
+        c.prereqs_within_3 = prereqs
+} """
+
+
+_RECOMMENDATIONS_QUERY = """
+// Collect the student's info and completed courses once
+MATCH (student:Student {id: $student_id})
+OPTIONAL MATCH (student)-[:HAS_COMPLETED]->(completed:Course)
+WITH student.name as student_name,
+     student.program as student_program,
+     collect(DISTINCT completed.code) as completed_codes
+
+// Find courses offered in target semester that aren't completed
+MATCH (available:Course)-[:OFFERED_IN]->(:Semester {id: $semester_id})
+WHERE NOT available.code IN completed_codes
+
+// Prerequisites and unlocked courses are matched in isolated subqueries
+CALL {
+    WITH available
+    OPTIONAL MATCH (available)-[:PRE_REQUIRES]->(prereq:Course)
+    RETURN collect(DISTINCT prereq.code) as required_prereqs
+}
+CALL {
+    WITH available
+    OPTIONAL MATCH (future:Course)-[:PRE_REQUIRES]->(available)
+    RETURN count(DISTINCT future) as unlocks_count
+}
+
+// Calculate readiness score (0-100)
+WITH student_name,
+     student_program,
+     available,
+     size(required_prereqs) as total_prereqs,
+     size([p IN required_prereqs WHERE NOT p IN completed_codes]) as missing_count,
+     unlocks_count
+WITH student_name,
+     student_program,
+     available,
+     missing_count,
+     unlocks_count,
+     CASE
+         WHEN total_prereqs = 0 THEN 100
+         WHEN missing_count = 0 THEN 100
+         ELSE toInteger(100.0 * (1.0 - toFloat(missing_count) / toFloat(total_prereqs)))
+     END as readiness_score
+
+// Filter by minimum readiness
+WHERE readiness_score >= $min_readiness
+
+RETURN available.code as course_code,
+       available.name as course_name,
+       available.credits as credits,
+       readiness_score,
+       missing_count as prerequisites_missing,
+       unlocks_count as future_courses_unlocked,
+       CASE
+           WHEN readiness_score = 100 THEN 'Ready Now'
+           WHEN readiness_score >= 75 THEN 'Almost Ready'
+           ELSE 'Not Ready'
+       END as status,
+       student_name,
+       student_program
+ORDER BY readiness_score DESC, unlocks_count DESC
+LIMIT $limit
+"""
+
+
+_RECOMMENDATIONS_STUDENT_QUERY = """
+MATCH (s:Student {id: $student_id})
+RETURN s.name as name, s.program as program
+"""
+
+
+_DEPTH_QUERY = """
+// Completion is checked with HAS_COMPLETED existence tests (an expand-into
+// bounded by the smaller degree) rather than scanning a list of codes per row
+MATCH (student:Student {id: $student_id})
+
+// Find remaining courses
+MATCH (remaining:Course)
+WHERE NOT EXISTS { (student)-[:HAS_COMPLETED]->(remaining) }
+
+// Count direct prerequisites
+CALL {
+    WITH student, remaining
+    OPTIONAL MATCH (remaining)-[:PRE_REQUIRES]->(direct_prereq:Course)
+    RETURN count(DISTINCT direct_prereq) as total_direct_prereqs,
+           count(DISTINCT CASE
+               WHEN NOT EXISTS { (student)-[:HAS_COMPLETED]->(direct_prereq) }
+               THEN direct_prereq
+           END) as missing_direct_prereqs
+}
+
+// Only show courses with prerequisites
+WITH student, remaining, total_direct_prereqs, missing_direct_prereqs
+WHERE total_direct_prereqs > 0
+
+// Get maximum depth of prerequisite chain (limited to 5)
+CALL {
+    WITH student, remaining
+    OPTIONAL MATCH path = (remaining)-[:PRE_REQUIRES*1..5]->(deep_prereq:Course)
+    WHERE NOT EXISTS { (student)-[:HAS_COMPLETED]->(deep_prereq) }
+    RETURN coalesce(max(length(path)), 0) as max_depth
+}
+
+RETURN remaining.code as course_code,
+       remaining.name as course_name,
+       total_direct_prereqs as total_prerequisites,
+       missing_direct_prereqs as prerequisites_missing,
+       max_depth as chain_depth,
+       // Semester availability (only the count is needed)
+       COUNT { (remaining)-[:OFFERED_IN]->(:Semester) } as semesters_offered,
+       CASE
+           WHEN missing_direct_prereqs = 0 THEN 'Ready Now'
+           WHEN missing_direct_prereqs <= 1 THEN 'Almost Ready'
+           WHEN missing_direct_prereqs <= 2 THEN 'Plan Soon'
+           ELSE 'Plan Later'
+       END as recommendation
+ORDER BY missing_direct_prereqs ASC, max_depth ASC, course_code
+LIMIT $limit
+"""
+
+
+_DEPTH_STUDENT_QUERY = """
+MATCH (s:Student {id: $student_id})
+OPTIONAL MATCH (s)-[:HAS_COMPLETED]->(c:Course)
+RETURN s.name as name,
+       s.program as program,
+       count(c) as completed_count
+"""
 
 
 class ModerateQueriesService:
@@ -22,6 +232,21 @@ class ModerateQueriesService:
         Creates a Neo4j driver connection for executing complex queries.
         """
         self.driver = get_neo4j_driver()
+        self.database = get_neo4j_database()
+
+        # Recommendations are cached per parameter set with the same size and
+        # lifetime as Neo4jClient's query cache; the route buckets its
+        # parameters so nearby requests land on the same entry.
+        self._recommendations_cache: TTLCache = TTLCache(
+            maxsize=int(os.getenv("NEO4J_QUERY_CACHE_SIZE", "1024")),
+            ttl=float(os.getenv("NEO4J_QUERY_CACHE_TTL", "60")),
+        )
+        self._recommendations_lock = threading.Lock()
+
+    def invalidate(self) -> None:
+        """Drop every cached course recommendation."""
+        with self._recommendations_lock:
+            self._recommendations_cache.clear()
 
     def find_bottleneck_courses(
         self, min_dependents: int = 3, min_prerequisites: int = 2, limit: int = 10
@@ -35,79 +260,64 @@ class ModerateQueriesService:
 
         Advanced patterns:
         - OPTIONAL MATCH with multiple patterns
-        - Variable-length paths: *1..3
+        - Quantified path pattern: (()-[:PRE_REQUIRES]->()){1,3}
         - Multiple WITH clauses
         - Aggregation: count(), collect()
 
         Args:
-            min_dependents: Minimum number of courses this must unlock
-            min_prerequisites: Minimum prerequisites required
+            min_dependents: Minimum number of courses this must unlock (at least 1)
+            min_prerequisites: Minimum prerequisites required (at least 1)
             limit: Maximum results to return
 
         Returns:
             List of bottleneck courses with metrics
         """
-        with self.driver.session() as session:
-            query = """
-            // Find courses that block progress
-            MATCH (bottleneck:Course)
-            
-            // Count courses that require this course
-            OPTIONAL MATCH (dependent:Course)-[:PRE_REQUIRES]->(bottleneck)
-            WITH bottleneck, count(DISTINCT dependent) as courses_this_unlocks
-            
-            // Count prerequisites for this course (depth 1-3)
-            OPTIONAL MATCH (bottleneck)-[:PRE_REQUIRES*1..3]->(prereq:Course)
-            WITH bottleneck, 
-                 courses_this_unlocks,
-                 count(DISTINCT prereq) as total_prereqs
-            
-            // Filter for bottlenecks
-            WHERE courses_this_unlocks >= $min_dependents 
-              AND total_prereqs >= $min_prerequisites
-            
-            // Get semester availability
-            OPTIONAL MATCH (bottleneck)-[:OFFERED_IN]->(sem:Semester)
-            WITH bottleneck,
-                 courses_this_unlocks,
-                 total_prereqs,
-                 collect(DISTINCT sem.name) as offered_semesters
-            
-            RETURN bottleneck.code as course_code,
-                   bottleneck.name as course_name,
-                   total_prereqs as prerequisites_needed,
-                   courses_this_unlocks as courses_unlocked,
-                   size(offered_semesters) as semesters_offered,
-                   offered_semesters[0..3] as sample_semesters
-            ORDER BY courses_this_unlocks DESC, total_prereqs DESC
-            LIMIT $limit
-            """
-
-            result = session.run(
-                query,
-                min_dependents=min_dependents,
-                min_prerequisites=min_prerequisites,
-                limit=limit,
+        # execute_query manages the session and retries on transient errors;
+        # Result.data hands back plain dicts without building an EagerResult
+        courses = self.driver.execute_query(
+            Query(
+                _BOTTLENECK_QUERY,
+                metadata={"query": "find_bottleneck_courses"},
+                timeout=query_timeout(),
+            ),
+            {
+                "min_dependents": min_dependents,
+                "min_prerequisites": min_prerequisites,
+                "limit": limit,
+            },
+            database_=self.database,
+            routing_=RoutingControl.READ,
+            result_transformer_=Result.data,
+        )
+
+        for course in courses:
+            course["bottleneck_score"] = (
+                course["courses_unlocked"] * 2 + course["prerequisites_needed"]
             )
 
-            courses = []
-            for record in result:
-                courses.append(
-                    {
-                        "course_code": record["course_code"],
-                        "course_name": record["course_name"],
-                        "prerequisites_needed": record["prerequisites_needed"],
-                        "courses_unlocked": record["courses_unlocked"],
-                        "semesters_offered": record["semesters_offered"],
-                        "sample_semesters": record["sample_semesters"],
-                        "bottleneck_score": (
-                            record["courses_unlocked"] * 2
-                            + record["prerequisites_needed"]
-                        ),
-                    }
-                )
+        return courses
 
-            return courses
+    def materialize_bottleneck_metrics(self) -> int:
+        """
+        Precompute the per-course metrics behind find_bottleneck_courses.
+
+        Stores `unlocks_count` (direct dependents) and `prereqs_within_3`
+        (distinct prerequisites up to three levels deep) on every Course, so
+        the bottleneck query reads properties instead of traversing. Run it
+        after any change to PRE_REQUIRES relationships.
+
+        Returns:
+            Number of properties written.
+        """
+        # CALL { ... } IN TRANSACTIONS must run in an auto-commit transaction
+        with self.driver.session(database=self.database) as session:
+            summary = session.run(
+                Query(
+                    _BOTTLENECK_METRICS_QUERY + in_transactions_clause(),
+                    metadata={"query": "materialize_bottleneck_metrics"},
+                )
+            ).consume()
+        return summary.counters.properties_set
 
     def get_course_recommendations(
         self,
@@ -135,109 +345,85 @@ class ModerateQueriesService:
             min_readiness: Minimum readiness score (0-100)
             limit: Maximum courses to return
 
+        Results are served from a short-lived cache keyed on all four
+        arguments; callers get their own copy and may modify it.
+
         Returns:
             Dict with student info and recommended courses
         """
-        with self.driver.session() as session:
-            query = """
-            // Get student and completed courses
-            MATCH (student:Student {id: $student_id})
-            OPTIONAL MATCH (student)-[:HAS_COMPLETED]->(completed:Course)
-            WITH student, collect(DISTINCT completed.code) as completed_codes
-            
-            // Find courses offered in target semester that aren't completed
-            MATCH (available:Course)-[:OFFERED_IN]->(sem:Semester {id: $semester_id})
-            WHERE NOT available.code IN completed_codes
-            
-            // Check prerequisites for each course
-            OPTIONAL MATCH (available)-[:PRE_REQUIRES]->(prereq:Course)
-            WITH student,
-                 available,
-                 completed_codes,
-                 collect(DISTINCT prereq.code) as required_prereqs
-            
-            // Calculate missing prerequisites
-            WITH student,
-                 available,
-                 required_prereqs,
-                 [p IN required_prereqs WHERE NOT p IN completed_codes] as missing_prereqs
-            
-            // Count courses this would unlock
-            OPTIONAL MATCH (future:Course)-[:PRE_REQUIRES]->(available)
-            WITH student,
-                 available,
-                 required_prereqs,
-                 missing_prereqs,
-                 count(DISTINCT future) as unlocks_count
-            
-            // Calculate readiness score (0-100)
-            WITH student,
-                 available,
-                 size(required_prereqs) as total_prereqs,
-                 size(missing_prereqs) as missing_count,
-                 unlocks_count,
-                 CASE 
-                     WHEN size(required_prereqs) = 0 THEN 100
-                     WHEN size(missing_prereqs) = 0 THEN 100
-                     ELSE toInteger(100.0 * (1.0 - toFloat(size(missing_prereqs)) / toFloat(size(required_prereqs))))
-                 END as readiness_score
-            
-            // Filter by minimum readiness
-            WHERE readiness_score >= $min_readiness
-            
-            RETURN available.code as course_code,
-                   available.name as course_name,
-                   available.credits as credits,
-                   readiness_score,
-                   missing_count as prerequisites_missing,
-                   unlocks_count as future_courses_unlocked,
-                   CASE 
-                       WHEN readiness_score = 100 THEN 'Ready Now'
-                       WHEN readiness_score >= 75 THEN 'Almost Ready'
-                       ELSE 'Not Ready'
-                   END as status
-            ORDER BY readiness_score DESC, unlocks_count DESC
-            LIMIT $limit
-            """
-
-            result = session.run(
-                query,
-                student_id=student_id,
-                semester_id=semester_id,
-                min_readiness=min_readiness,
-                limit=limit,
+        key = (student_id, semester_id, min_readiness, limit)
+        with self._recommendations_lock:
+            cached = self._recommendations_cache.get(key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+
+        with self.driver.session(database=self.database) as session:
+            result = session.execute_read(
+                timed_work("get_course_recommendations", self._fetch_course_recommendations),
+                student_id,
+                semester_id,
+                min_readiness,
+                limit,
             )
 
-            # Get student info
-            student_query = """
-            MATCH (s:Student {id: $student_id})
-            RETURN s.name as name, s.program as program
-            """
-            student_result = session.run(student_query, student_id=student_id)
-            student_record = student_result.single()
-
-            courses = []
-            for record in result:
-                courses.append(
-                    {
-                        "course_code": record["course_code"],
-                        "course_name": record["course_name"],
-                        "credits": record["credits"] or 3,
-                        "readiness_score": record["readiness_score"],
-                        "prerequisites_missing": record["prerequisites_missing"],
-                        "future_courses_unlocked": record["future_courses_unlocked"],
-                        "status": record["status"],
-                    }
-                )
+        with self._recommendations_lock:
+            self._recommendations_cache[key] = copy.deepcopy(result)
+        return result
 
-            return {
-                "student_id": student_id,
-                "student_name": student_record["name"] if student_record else None,
-                "program": student_record["program"] if student_record else None,
-                "semester_id": semester_id,
-                "recommendations": courses,
-                "total_recommendations": len(courses),
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def _fetch_course_recommendations(
+        self,
+        tx: Any,
+        student_id: str,
+        semester_id: str,
+        min_readiness: int,
+        limit: int,
+    ) -> Dict[str, Any]:
+        """
+        Run the recommendation queries inside an existing read transaction.
+
+        Args:
+            tx: Neo4j managed transaction.
+            student_id: Student ID
+            semester_id: Target semester (e.g., 'FALL_2024')
+            min_readiness: Minimum readiness score (0-100)
+            limit: Maximum courses to return
+
+        Returns:
+            Dict with student info and recommended courses
+        """
+        courses = tx.run(
+            _RECOMMENDATIONS_QUERY,
+            student_id=student_id,
+            semester_id=semester_id,
+            min_readiness=min_readiness,
+            limit=limit,
+        ).data()
+
+        # Student info rides along on every row; look it up separately only
+        # when nothing was recommended
+        if courses:
+            student_record = {
+                "name": courses[0]["student_name"],
+                "program": courses[0]["student_program"],
             }
+        else:
+            student_record = tx.run(
+                _RECOMMENDATIONS_STUDENT_QUERY, student_id=student_id
+            ).single()
+
+        for course in courses:
+            del course["student_name"], course["student_program"]
+            course["credits"] = course["credits"] or 3
+
+        return {
+            "student_id": student_id,
+            "student_name": student_record["name"] if student_record else None,
+            "program": student_record["program"] if student_record else None,
+            "semester_id": semester_id,
+            "recommendations": courses,
+            "total_recommendations": len(courses),
+        }
 
     def get_courses_by_prerequisite_depth(self, student_id: str, limit: int = 20) -> Dict[str, Any]:
         """
@@ -259,129 +445,93 @@ class ModerateQueriesService:
         Returns:
             Dict with courses organized by readiness
         """
-        with self.driver.session() as session:
-            query = """
-            // Get student and completed courses
-            MATCH (student:Student {id: $student_id})
-            OPTIONAL MATCH (student)-[:HAS_COMPLETED]->(completed:Course)
-            WITH student, collect(DISTINCT completed.code) as completed_codes
-            
-            // Find remaining courses
-            MATCH (remaining:Course)
-            WHERE NOT remaining.code IN completed_codes
-            
-            // Count direct prerequisites
-            OPTIONAL MATCH (remaining)-[:PRE_REQUIRES]->(direct_prereq:Course)
-            WITH student,
-                 remaining,
-                 completed_codes,
-                 collect(DISTINCT direct_prereq.code) as direct_prereqs
-            
-            // Calculate missing direct prerequisites
-            WITH student,
-                 remaining,
-                 direct_prereqs,
-                 [p IN direct_prereqs WHERE NOT p IN completed_codes] as missing_prereqs
-            
-            // Get maximum depth of prerequisite chain (limited to 5)
-            OPTIONAL MATCH path = (remaining)-[:PRE_REQUIRES*1..5]->(deep_prereq:Course)
-            WHERE NOT deep_prereq.code IN completed_codes
-            WITH student,
-                 remaining,
-                 size(direct_prereqs) as total_direct_prereqs,
-                 size(missing_prereqs) as missing_direct_prereqs,
-                 CASE 
-                     WHEN count(path) = 0 THEN 0
-                     ELSE max(length(path))
-                 END as max_depth
-            
-            // Get semester availability
-            OPTIONAL MATCH (remaining)-[:OFFERED_IN]->(sem:Semester)
-            WITH remaining,
-                 total_direct_prereqs,
-                 missing_direct_prereqs,
-                 max_depth,
-                 count(DISTINCT sem) as semesters_offered
-            
-            // Only show courses with prerequisites
-            WHERE total_direct_prereqs > 0
-            
-            RETURN remaining.code as course_code,
-                   remaining.name as course_name,
-                   total_direct_prereqs as total_prerequisites,
-                   missing_direct_prereqs as prerequisites_missing,
-                   max_depth as chain_depth,
-                   semesters_offered,
-                   CASE 
-                       WHEN missing_direct_prereqs = 0 THEN 'Ready Now'
-                       WHEN missing_direct_prereqs <= 1 THEN 'Almost Ready'
-                       WHEN missing_direct_prereqs <= 2 THEN 'Plan Soon'
-                       ELSE 'Plan Later'
-                   END as recommendation
-            ORDER BY missing_direct_prereqs ASC, max_depth ASC, course_code
-            LIMIT $limit
-            """
-
-            result = session.run(
-                query, student_id=student_id, limit=limit
+        with self.driver.session(database=self.database) as session:
+            return session.execute_read(
+                timed_work(
+                    "get_courses_by_prerequisite_depth",
+                    self._fetch_courses_by_prerequisite_depth,
+                ),
+                student_id,
+                limit,
             )
 
-            # Get student info
-            student_query = """
-            MATCH (s:Student {id: $student_id})
-            OPTIONAL MATCH (s)-[:HAS_COMPLETED]->(c:Course)
-            RETURN s.name as name, 
-                   s.program as program,
-                   count(c) as completed_count
-            """
-            student_result = session.run(student_query, student_id=student_id)
-            student_record = student_result.single()
-
-            # Organize courses by recommendation
-            courses_by_status = {
-                "ready_now": [],
-                "almost_ready": [],
-                "plan_soon": [],
-                "plan_later": [],
-            }
+    def _fetch_courses_by_prerequisite_depth(
+        self,
+        tx: Any,
+        student_id: str,
+        limit: int,
+    ) -> Dict[str, Any]:
+        """
+        Run the prerequisite-depth queries inside an existing read transaction.
+
+        Args:
+            tx: Neo4j managed transaction.
+            student_id: Student ID
+            limit: Maximum courses to return
+
+        Returns:
+            Dict with courses organized by readiness
+        """
+        result = tx.run(_DEPTH_QUERY, student_id=student_id, limit=limit)
+
+        # Get student info
+        student_result = tx.run(_DEPTH_STUDENT_QUERY, student_id=student_id)
+        student_record = student_result.single()
+
+        # Organize courses by recommendation
+        courses_by_status = {
+            "ready_now": [],
+            "almost_ready": [],
+            "plan_soon": [],
+            "plan_later": [],
+        }
+
+        all_courses = result.data()
+        for course in all_courses:
+            # Categorize
+            status = course["recommendation"].lower().replace(" ", "_")
+            if status in courses_by_status:
+                courses_by_status[status].append(course)
+
+        return {
+            "student_id": student_id,
+            "student_name": student_record["name"] if student_record else None,
+            "program": student_record["program"] if student_record else None,
+            "completed_courses": student_record["completed_count"] if student_record else 0,
+            "courses_by_status": courses_by_status,
+            "all_courses": all_courses,
+            "total_remaining": len(all_courses),
+        }
+
+    def get_student_summary_bundle(self, student_id: str, semester_id: str) -> Dict[str, Any]:
+        """
+        Fetch everything the student summary needs in a single read transaction.
 
-            all_courses = []
-            for record in result:
-                course = {
-                    "course_code": record["course_code"],
-                    "course_name": record["course_name"],
-                    "total_prerequisites": record["total_prerequisites"],
-                    "prerequisites_missing": record["prerequisites_missing"],
-                    "chain_depth": record["chain_depth"],
-                    "semesters_offered": record["semesters_offered"],
-                    "recommendation": record["recommendation"],
-                }
-                all_courses.append(course)
-
-                # Categorize
-                status = record["recommendation"].lower().replace(" ", "_")
-                if status in courses_by_status:
-                    courses_by_status[status].append(course)
+        Runs the recommendation and prerequisite-depth queries on the same
+        transaction instead of opening one per analysis.
 
+        Args:
+            student_id: Student ID
+            semester_id: Target semester for recommendations
+
+        Returns:
+            Dict with "recommendations" and "depth" results, shaped like
+            get_course_recommendations and get_courses_by_prerequisite_depth
+        """
+
+        def _work(tx: Any) -> Dict[str, Any]:
             return {
-                "student_id": student_id,
-                "student_name": student_record["name"] if student_record else None,
-                "program": student_record["program"] if student_record else None,
-                "completed_courses": student_record["completed_count"] if student_record else 0,
-                "courses_by_status": courses_by_status,
-                "all_courses": all_courses,
-                "total_remaining": len(all_courses),
+                "recommendations": self._fetch_course_recommendations(
+                    tx, student_id, semester_id, 75, 10
+                ),
+                "depth": self._fetch_courses_by_prerequisite_depth(tx, student_id, 20),
             }
 
-
-# Singleton instance
-_MODERATE_QUERIES_SERVICE = None
+        with self.driver.session(database=self.database) as session:
+            return session.execute_read(timed_work("get_student_summary", _work))
 
 
+@singleton
 def get_moderate_queries_service() -> ModerateQueriesService:
     """Get or create moderate queries service instance"""
-    # pylint: disable=global-statement
-    global _MODERATE_QUERIES_SERVICE
-    if _MODERATE_QUERIES_SERVICE is None:
-        _MODERATE_QUERIES_SERVICE = ModerateQueriesService()
-    return _MODERATE_QUERIES_SERVICE
+    return ModerateQueriesService()
@@ -5,15 +5,24 @@ Provides functions for planning degree completion by determining remaining cours
 and generating a recommended sequence based on prerequisite dependencies.
 """
 
-from typing import Dict, List, Optional, Union
+import threading
+from graphlib import CycleError, TopologicalSorter
+from typing import Dict, List, Optional, Set, Union
 
-from backend.database.neo4j import get_neo4j_client
+from cachetools import TTLCache, cached
 
+from backend.database.neo4j import get_neo4j_client, get_read_executor
 
+
+@cached(cache=TTLCache(maxsize=128, ttl=3600), lock=threading.Lock())
 def get_degree_requirements(degree_id: str) -> List[str]:
     """
     Get all courses required for a degree.
 
+    Results are memoized per degree for an hour, since requirements change
+    at most once a semester. Call get_degree_requirements.cache_clear()
+    after editing them. Callers must not mutate the returned list.
+
     Args:
         degree_id: The degree ID to get requirements for.
 
@@ -21,7 +30,7 @@ def get_degree_requirements(degree_id: str) -> List[str]:
         List of required course codes.
     """
     cypher = """
-    MATCH (c:Course)-[:REQUIRED_FOR]->(d:Degree {degree_id: $degree_id})
+    MATCH (c:Course)-[:REQUIRED_FOR]->(d:Degree {id: $degree_id})
     RETURN c.code AS course
     """
     result = get_neo4j_client().query(cypher, {"degree_id": degree_id})
@@ -46,22 +55,27 @@ def get_completed_courses(student_id: str) -> List[str]:
     return [row["course"] for row in result]
 
 
-def get_direct_prereqs(course: str) -> List[str]:
+def get_direct_prereqs_map(courses: List[str]) -> Dict[str, Set[str]]:
     """
-    Get direct prerequisites for a course.
+    Get direct prerequisites for several courses in a single query.
 
     Args:
-        course: The course code to get prerequisites for.
+        courses: List of course codes to get prerequisites for.
 
     Returns:
-        List of direct prerequisite course codes.
+        Dictionary mapping each course to its set of direct prerequisites
+        (empty for courses without any).
     """
     cypher = """
-    MATCH (p:Course)-[:PRE_REQUIRES]->(c:Course {code: $course})
-    RETURN p.code AS prereq
+    MATCH (p:Course)-[:PRE_REQUIRES]->(c:Course)
+    WHERE c.code IN $codes
+    RETURN c.code AS course, collect(p.code) AS prereqs
     """
-    result = get_neo4j_client().query(cypher, {"course": course})
-    return [row["prereq"] for row in result]
+    result = get_neo4j_client().query(cypher, {"codes": list(courses)})
+    graph: Dict[str, Set[str]] = {c: set() for c in courses}
+    for row in result:
+        graph[row["course"]] = set(row["prereqs"])
+    return graph
 
 
 def degree_topological_sort(courses: List[str]) -> Optional[List[List[str]]]:
@@ -75,20 +89,21 @@ def degree_topological_sort(courses: List[str]) -> Optional[List[List[str]]]:
         List of lists, where each inner list contains courses that can be taken
         in the same semester. Returns None if a cycle is detected.
     """
-    graph = {c: set(get_direct_prereqs(c)) for c in courses}
-
-    sequence = []
+    graph = get_direct_prereqs_map(courses)
     remaining = set(courses)
 
-    while remaining:
-        # Find courses whose prerequisites are not still missing
-        available = [c for c in remaining if not graph[c] & remaining]
-
-        if not available:
-            return None  # Cycle detected
+    # Only prerequisites that are still missing gate the ordering
+    sorter = TopologicalSorter({c: graph[c] & remaining for c in courses})
+    try:
+        sorter.prepare()
+    except CycleError:
+        return None
 
+    sequence = []
+    while sorter.is_active():
+        available = sorter.get_ready()
         sequence.append(sorted(available))
-        remaining -= set(available)
+        sorter.done(*available)
 
     return sequence
 
@@ -111,8 +126,10 @@ def plan_degree(
         - recommended_sequence: List of semesters, each containing courses to take
         - warning: Optional warning message if cycle detected
     """
+    # Independent reads: run them concurrently
+    completed_future = get_read_executor().submit(get_completed_courses, student_id)
     required = set(get_degree_requirements(degree_id))
-    completed = set(get_completed_courses(student_id))
+    completed = set(completed_future.result())
 
     missing = sorted(required - completed)
 
@@ -5,13 +5,13 @@ Generates all possible valid graduation paths by enumerating all topological
 orderings of remaining courses based on prerequisite dependencies.
 """
 
-from typing import Dict, List, Set, Union
+from itertools import islice
+from typing import Dict, Iterator, List, Optional, Set, Tuple, Union
 
-from backend.database.neo4j import get_neo4j_client
+from backend.database.neo4j import get_neo4j_client, get_read_executor
 from backend.services.degree_planner_service import (
     get_completed_courses,
     get_degree_requirements,
-    get_direct_prereqs,
 )
 
 
@@ -19,94 +19,160 @@ def build_graph(courses: List[str]) -> Dict[str, Set[str]]:
     """
     Build a prerequisite dependency graph for courses.
 
+    All edges are fetched in one query. Only prerequisites that are
+    themselves in ``courses`` are kept, so completed courses never gate the
+    ordering.
+
     Args:
         courses: List of course codes to build graph for.
 
     Returns:
-        Dictionary mapping each course to its set of direct prerequisites.
+        Dictionary mapping each course to its set of direct prerequisites
+        within ``courses``.
+    """
+    cypher = """
+    MATCH (p:Course)-[:PRE_REQUIRES]->(c:Course)
+    WHERE c.code IN $missing AND p.code IN $missing
+    RETURN c.code AS course, collect(p.code) AS prereqs
     """
-    graph = {c: set(get_direct_prereqs(c)) for c in courses}
+    result = get_neo4j_client().query(cypher, {"missing": list(courses)})
+    graph: Dict[str, Set[str]] = {c: set() for c in courses}
+    for row in result:
+        graph[row["course"]] = set(row["prereqs"])
     return graph
 
 
-def all_topological_orders(graph: Dict[str, Set[str]]) -> List[List[str]]:
+def all_topological_orders(
+    graph: Dict[str, Set[str]], max_paths: Optional[int] = None
+) -> Iterator[List[str]]:
     """
     Generate all possible topological orderings of courses.
 
     Uses depth-first search with backtracking to enumerate all valid orderings
-    that respect prerequisite dependencies.
+    that respect prerequisite dependencies. Courses are numbered and the
+    courses whose prerequisites are all placed are kept as an integer bitmask,
+    updated incrementally through in-degree counts: placing a course only
+    touches its successors, so each step tries ready courses alone instead of
+    re-checking every unplaced one. The search keeps an explicit stack
+    instead of recursing, so long course lists never approach the recursion
+    limit.
+
+    Orderings are yielded as they are found; the number of orderings grows
+    factorially with independent courses, so callers should bound it.
 
     Args:
         graph: Dictionary mapping courses to their prerequisite sets.
+        max_paths: Stop after this many orderings (None for no limit).
 
-    Returns:
-        List of all valid course orderings, where each ordering is a list of course codes.
+    Yields:
+        Valid course orderings, each a list of course codes.
+    """
+    courses = list(graph)
+    index = {course: i for i, course in enumerate(courses)}
+    successors: List[List[int]] = [[] for _ in courses]
+    in_degree = [0] * len(courses)
+    for course in courses:
+        for prereq in graph[course]:
+            if prereq in index:
+                successors[index[prereq]].append(index[course])
+                in_degree[index[course]] += 1
+    initial_ready = sum(1 << i for i, degree in enumerate(in_degree) if degree == 0)
+
+    def walk() -> Iterator[List[str]]:
+        order: List[int] = []
+        # One frame per placed course: [ready mask, untried ready courses, placed any]
+        stack = [[initial_ready, initial_ready, False]]
+        while stack:
+            frame = stack[-1]
+            untried = frame[1]
+
+            if untried:
+                bit = untried & -untried
+                frame[1] = untried ^ bit
+                frame[2] = True
+                i = bit.bit_length() - 1
+                order.append(i)
+
+                # Placing i releases successors whose last prerequisite it was
+                ready = frame[0] & ~bit
+                for j in successors[i]:
+                    in_degree[j] -= 1
+                    if not in_degree[j]:
+                        ready |= 1 << j
+                stack.append([ready, ready, False])
+                continue
+
+            if not frame[2]:
+                # Completed valid ordering
+                yield [courses[i] for i in order]
+
+            # Backtrack
+            stack.pop()
+            if order:
+                for j in successors[order.pop()]:
+                    in_degree[j] += 1
+
+    return islice(walk(), max_paths)
+
+
+def _remaining_courses(student_id: str) -> Optional[Tuple[str, List[str]]]:
     """
-    results: List[List[str]] = []
-    visited: Set[str] = set()
-    order: List[str] = []
+    Look up a student's degree and the courses they still need for it.
 
-    def dfs() -> None:
-        added = False
-        for node in graph:
-            if node not in visited:
-                # Check if all prerequisites are already in order
-                if all(p in visited for p in graph[node]):
-                    visited.add(node)
-                    order.append(node)
+    Args:
+        student_id: The student ID to look up.
 
-                    dfs()
+    Returns:
+        Tuple of (degree ID, sorted missing course codes), or None if the
+        student is not enrolled in a degree.
+    """
+    # Completed courses don't depend on the degree; fetch them meanwhile
+    completed_future = get_read_executor().submit(get_completed_courses, student_id)
 
-                    # Backtrack
-                    visited.remove(node)
-                    order.pop()
+    degree_result = get_neo4j_client().query(
+        """
+        MATCH (s:Student {student_id: $sid})-[:ENROLLED_IN]->(d:Degree)
+        RETURN d.id AS degree
+        """,
+        {"sid": student_id},
+    )
 
-                    added = True
+    if not degree_result:
+        completed_future.cancel()
+        return None
 
-        if not added:
-            # Completed valid ordering
-            results.append(order.copy())
+    degree_id = degree_result[0]["degree"]
 
-    dfs()
-    return results
+    # Required courses
+    required = set(get_degree_requirements(degree_id))
+    completed = set(completed_future.result())
+    return degree_id, sorted(required - completed)
 
 
 def generate_graduation_paths(
-    student_id: str
+    student_id: str, max_paths: Optional[int] = None
 ) -> Dict[str, Union[str, List[str], List[List[str]]]]:
     """
     Generate all possible graduation paths for a student.
 
     Args:
         student_id: The student ID to generate paths for.
+        max_paths: Maximum number of paths to return (None for all).
 
     Returns:
         Dictionary containing:
         - student_id: Student ID
         - degree_id: Degree ID
         - missing_courses: List of courses still needed
-        - paths: List of all valid course orderings
+        - paths: List of valid course orderings
         - error: Optional error message if student not found
     """
-    client = get_neo4j_client()
-
-    degree_result = client.query(
-        """
-        MATCH (s:Student {student_id: $sid})-[:ENROLLED_IN]->(d:Degree)
-        RETURN d.degree_id AS degree
-        """,
-        {"sid": student_id},
-    )
+    remaining = _remaining_courses(student_id)
 
-    if not degree_result:
+    if remaining is None:
         return {"error": "Student not found"}
 
-    degree_id = degree_result[0]["degree"]
-
-    # Required courses
-    required = set(get_degree_requirements(degree_id))
-    completed = set(get_completed_courses(student_id))
-    missing = sorted(required - completed)
+    degree_id, missing = remaining
 
     if not missing:
         return {"student_id": student_id, "degree_id": degree_id, "paths": [["Already graduated"]]}
@@ -114,8 +180,8 @@ def generate_graduation_paths(
     # Build dependency graph
     graph = build_graph(missing)
 
-    # Enumerate all valid paths
-    paths = all_topological_orders(graph)
+    # Enumerate valid paths
+    paths = list(all_topological_orders(graph, max_paths))
 
     return {
         "student_id": student_id,
@@ -123,3 +189,29 @@ def generate_graduation_paths(
         "missing_courses": missing,
         "paths": paths,
     }
+
+
+def stream_graduation_paths(
+    student_id: str, max_paths: Optional[int] = None
+) -> Optional[Iterator[List[str]]]:
+    """
+    Lazily generate graduation paths for a student, one ordering at a time.
+
+    Args:
+        student_id: The student ID to generate paths for.
+        max_paths: Stop after this many paths (None for all).
+
+    Returns:
+        Iterator over valid course orderings, or None if student not found.
+    """
+    remaining = _remaining_courses(student_id)
+
+    if remaining is None:
+        return None
+
+    _, missing = remaining
+
+    if not missing:
+        return iter([["Already graduated"]])
+
+    return all_topological_orders(build_graph(missing), max_paths)
@@ -5,9 +5,18 @@ Provides functions for querying course prerequisites, detecting cycles,
 and validating student eligibility based on completed courses.
 """
 
-from typing import Dict, List, Union
+import threading
+from graphlib import CycleError, TopologicalSorter
+from typing import Dict, FrozenSet, List, Optional, Set, Union
 
-from backend.database.neo4j import get_neo4j_client
+from backend.database.neo4j import get_neo4j_client, in_transactions_clause
+
+# In-memory transitive prerequisite table: course code -> every prerequisite
+# (direct and indirect), and the direct PRE_REQUIRES adjacency it was built
+# from. Loaded on first use, rebuilt together by load_prerequisite_table.
+_PREREQ_TABLE: Optional[Dict[str, FrozenSet[str]]] = None
+_PREREQ_GRAPH: Optional[Dict[str, List[str]]] = None
+_PREREQ_TABLE_LOCK = threading.RLock()
 
 
 def get_direct_prerequisites(course_code: str) -> List[str]:
@@ -30,24 +39,257 @@ def get_direct_prerequisites(course_code: str) -> List[str]:
     return [r["code"] for r in results]
 
 
-def get_all_prerequisites(course_code: str) -> List[str]:
+def _transitive_closure(direct: Dict[str, List[str]]) -> Dict[str, FrozenSet[str]]:
     """
-    Get all prerequisites (direct + indirect/transitive).
+    Expand direct prerequisite lists into full transitive prerequisite sets.
+
+    Courses are visited in topological order so each closure is built from
+    its prerequisites' closures. If the graph has a cycle, every course
+    falls back to its own breadth-first expansion.
 
     Args:
-        course_code: The course code to get all prerequisites for.
+        direct: Mapping of course code to its direct prerequisite codes.
+
+    Returns:
+        Mapping of course code to all of its prerequisite codes.
+    """
+    closure: Dict[str, FrozenSet[str]] = {}
+    try:
+        order = list(TopologicalSorter(direct).static_order())
+    except CycleError:
+        for course in direct:
+            seen = set()
+            frontier = list(direct[course])
+            while frontier:
+                prereq = frontier.pop()
+                if prereq not in seen:
+                    seen.add(prereq)
+                    frontier.extend(direct.get(prereq, ()))
+            closure[course] = frozenset(seen)
+        return closure
+
+    for course in order:
+        prereqs = set(direct.get(course, ()))
+        for prereq in direct.get(course, ()):
+            prereqs |= closure[prereq]
+        closure[course] = frozenset(prereqs)
+    return {course: closure[course] for course in direct}
+
+
+def _fetch_direct_prerequisites() -> Dict[str, List[str]]:
+    """
+    Fetch every course's direct prerequisites in a single query.
+
+    Rows are streamed straight into the adjacency dict rather than collected
+    into a list first, and they bypass the query-result cache, so a reload
+    always sees the current graph.
 
     Returns:
-        List of all prerequisite course codes (direct and indirect), sorted alphabetically.
+        Dictionary mapping each course code to its direct prerequisite codes.
     """
     client = get_neo4j_client()
     query = """
-    MATCH (c:Course {code: $code})-[:PRE_REQUIRES*1..10]->(p:Course)
-    RETURN DISTINCT p.code AS code
-    ORDER BY code
+    MATCH (c:Course)
+    OPTIONAL MATCH (c)-[:PRE_REQUIRES]->(p:Course)
+    RETURN c.code AS code, collect(p.code) AS prereqs
     """
-    results = client.query(query, {"code": course_code}, read_only=True)
-    return [r["code"] for r in results]
+    return {r["code"]: r["prereqs"] for r in client.stream_query(query)}
+
+
+def load_prerequisite_table() -> int:
+    """
+    (Re)build the in-memory transitive prerequisite table from Neo4j.
+
+    The whole PRE_REQUIRES graph is fetched in one query and expanded in
+    Python, so eligibility checks can be answered without a traversal. The
+    direct adjacency is kept as well for cycle detection.
+
+    Returns:
+        Number of courses in the table.
+    """
+    graph = _fetch_direct_prerequisites()
+    table = _transitive_closure(graph)
+
+    # pylint: disable=global-statement
+    global _PREREQ_TABLE, _PREREQ_GRAPH
+    with _PREREQ_TABLE_LOCK:
+        _PREREQ_TABLE = table
+        _PREREQ_GRAPH = graph
+    return len(table)
+
+
+def get_prerequisite_table() -> Dict[str, FrozenSet[str]]:
+    """
+    Get the in-memory transitive prerequisite table, loading it on first use.
+
+    Returns:
+        Mapping of course code to all of its prerequisite codes.
+    """
+    with _PREREQ_TABLE_LOCK:
+        if _PREREQ_TABLE is None:
+            load_prerequisite_table()
+        return _PREREQ_TABLE
+
+
+def get_prerequisite_graph() -> Dict[str, List[str]]:
+    """
+    Get the in-memory direct prerequisite adjacency, loading it on first use.
+
+    Returns:
+        Mapping of course code to its direct prerequisite codes.
+    """
+    with _PREREQ_TABLE_LOCK:
+        if _PREREQ_GRAPH is None:
+            load_prerequisite_table()
+        return _PREREQ_GRAPH
+
+
+def materialize_prerequisite_closure() -> int:
+    """
+    Precompute every course's transitive prerequisites and chain depth.
+
+    Stores the closure on each Course node as `prereq_set` (list of codes)
+    and `prereq_depth` (longest prerequisite chain), so request-time queries
+    read a property instead of expanding variable-length paths. Run it after
+    any change to PRE_REQUIRES relationships; the in-memory prerequisite
+    table is reloaded as well.
+
+    Returns:
+        Number of properties written.
+    """
+    client = get_neo4j_client()
+    # Each batch only writes its own Course nodes, so batches may run in parallel
+    query = f"""
+    MATCH (c:Course)
+    CALL {{
+        WITH c
+        OPTIONAL MATCH path = (c)-[:PRE_REQUIRES*1..10]->(p:Course)
+        WITH c,
+             collect(DISTINCT p.code) AS prereqs,
+             coalesce(max(length(path)), 0) AS depth
+        SET c.prereq_set = prereqs,
+            c.prereq_depth = depth
+    }} {in_transactions_clause()}
+    """
+    # CALL { ... } IN TRANSACTIONS must run in an auto-commit transaction
+    with client.session() as session:
+        summary = session.run(query).consume()
+
+    client.invalidate()
+    load_prerequisite_table()
+    return summary.counters.properties_set
+
+
+def _strongly_connected_components(direct: Dict[str, List[str]]) -> List[List[str]]:
+    """
+    Tarjan's strongly connected components, iterative to avoid deep recursion.
+
+    Args:
+        direct: Mapping of course code to its direct prerequisite codes.
+
+    Returns:
+        List of components, each a list of course codes.
+    """
+    index: Dict[str, int] = {}
+    lowlink: Dict[str, int] = {}
+    on_stack: Set[str] = set()
+    stack: List[str] = []
+    components: List[List[str]] = []
+
+    for root in direct:
+        if root in index:
+            continue
+        index[root] = lowlink[root] = len(index)
+        stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(direct.get(root, ())))]
+        while work:
+            node, edges = work[-1]
+            for nxt in edges:
+                if nxt not in index:
+                    index[nxt] = lowlink[nxt] = len(index)
+                    stack.append(nxt)
+                    on_stack.add(nxt)
+                    work.append((nxt, iter(direct.get(nxt, ()))))
+                    break
+                if nxt in on_stack:
+                    lowlink[node] = min(lowlink[node], index[nxt])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+                if lowlink[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(component)
+    return components
+
+
+def _shortest_cycle(start: str, direct: Dict[str, List[str]], members: Set[str]) -> List[str]:
+    """
+    Shortest PRE_REQUIRES cycle through `start`, staying inside its component.
+
+    Args:
+        start: Course code the cycle starts and ends at.
+        direct: Mapping of course code to its direct prerequisite codes.
+        members: Codes of the strongly connected component containing start.
+
+    Returns:
+        Path of course codes beginning and ending with `start`.
+    """
+    parents: Dict[str, Optional[str]] = {start: None}
+    frontier = [start]
+    while frontier:
+        next_frontier = []
+        for node in frontier:
+            for nxt in direct.get(node, ()):
+                if nxt == start:
+                    path = [start]
+                    while node is not None:
+                        path.append(node)
+                        node = parents[node]
+                    return path[::-1]
+                if nxt in members and nxt not in parents:
+                    parents[nxt] = node
+                    next_frontier.append(nxt)
+        frontier = next_frontier
+    return [start]
+
+
+def _has_cycle(direct: Dict[str, List[str]]) -> bool:
+    """
+    Check whether a direct prerequisite mapping contains any cycle.
+
+    Args:
+        direct: Mapping of course code to its direct prerequisite codes.
+
+    Returns:
+        True if at least one course (transitively) requires itself.
+    """
+    try:
+        TopologicalSorter(direct).prepare()
+    except CycleError:
+        return True
+    return False
+
+
+def has_cycles() -> bool:
+    """
+    Check whether the prerequisite graph contains any cycle.
+
+    Cheaper than detect_cycles when only a yes/no answer is needed: no
+    components or cycle paths are built.
+
+    Returns:
+        True if at least one course (transitively) requires itself.
+    """
+    return _has_cycle(get_prerequisite_graph())
 
 
 def detect_cycles(limit: int = 20) -> List[Dict[str, Union[str, int, List[str]]]]:
@@ -57,22 +299,34 @@ def detect_cycles(limit: int = 20) -> List[Dict[str, Union[str, int, List[str]]]
     A cycle occurs when course A requires course B, and course B (directly or indirectly)
     requires course A, creating a circular dependency.
 
+    The direct PRE_REQUIRES adjacency is held in memory alongside the
+    prerequisite table (refreshed by load_prerequisite_table) and grouped into
+    strongly connected components in Python (Tarjan, O(V+E)), so cycles of
+    any length are found without a Neo4j round-trip. One shortest cycle is
+    reported per component.
+
     Args:
         limit: Maximum number of cycles to return.
 
     Returns:
         List of dictionaries, each containing course code, cycle length, and path of courses.
     """
-    client = get_neo4j_client()
-    query = """
-    MATCH p = (c:Course)-[:PRE_REQUIRES*1..10]->(c)
-    RETURN c.code AS course,
-           length(p) AS length,
-           [n IN nodes(p) | n.code] AS path
-    LIMIT $limit
-    """
-    results = client.query(query, {"limit": limit}, read_only=True)
-    return results
+    # Catalogs are normally acyclic; skip the component search in that case
+    if not has_cycles():
+        return []
+
+    direct = get_prerequisite_graph()
+
+    cycles = []
+    for component in _strongly_connected_components(direct):
+        start = min(component)
+        if len(component) == 1 and start not in direct.get(start, ()):
+            continue
+        path = _shortest_cycle(start, direct, set(component))
+        cycles.append({"course": start, "length": len(path) - 1, "path": path})
+
+    cycles.sort(key=lambda cycle: cycle["course"])
+    return cycles[:limit]
 
 
 def check_student_can_take(
@@ -96,62 +350,86 @@ def check_student_can_take(
         - reason: Reason code ("ok", "course_not_found",
           "student_not_found", "missing_prerequisites")
     """
-    client = get_neo4j_client()
+    return check_student_can_take_batch(student_id, [course_code])[0]
 
-    # get all prerequisites for the course
-    query = """
-    MATCH (target:Course {code: $course_code})
-    OPTIONAL MATCH (target)-[:PRE_REQUIRES*1..10]->(req:Course)
-    WITH target, COLLECT(DISTINCT req.code) AS required
-    
-    OPTIONAL MATCH (s:Student {student_id: $student_id})
-    OPTIONAL MATCH (s)-[:HAS_COMPLETED]->(done:Course)
-    WITH target, required, s, COLLECT(DISTINCT done.code) AS completed
-    
-    RETURN target.code AS course, required, completed, s IS NOT NULL AS student_exists
-    """
-
-    results = client.query(
-        query, {"student_id": student_id, "course_code": course_code}, read_only=True
-    )
-
-    if not results:
-        return {
-            "student_id": student_id,
-            "course": course_code,
-            "required": [],
-            "completed": [],
-            "missing": [],
-            "can_take": False,
-            "reason": "course_not_found",
-        }
-
-    row = results[0]
-    required = row.get("required") or []
-    completed = row.get("completed") or []
-
-    if not row.get("student_exists", False):
-        return {
+
+def check_student_can_take_batch(
+    student_id: str, course_codes: List[str]
+) -> List[Dict[str, Union[str, List[str], bool]]]:
+    """
+    Check whether a student can take each of several courses.
+
+    Required prerequisites come from the in-memory prerequisite table and the
+    student's completed courses are fetched once, so the whole batch costs
+    at most one query.
+
+    Args:
+        student_id: The student ID to check.
+        course_codes: The course codes to check eligibility for.
+
+    Returns:
+        One dictionary per requested course, in request order, shaped like
+        the result of check_student_can_take.
+    """
+    table = get_prerequisite_table()
+
+    student_exists = False
+    completed: List[str] = []
+    if any(code in table for code in course_codes):
+        client = get_neo4j_client()
+        query = """
+        OPTIONAL MATCH (s:Student {student_id: $student_id})
+        OPTIONAL MATCH (s)-[:HAS_COMPLETED]->(done:Course)
+        RETURN s IS NOT NULL AS student_exists, COLLECT(DISTINCT done.code) AS completed
+        """
+        results = client.query(query, {"student_id": student_id}, read_only=True)
+
+        row = results[0] if results else {}
+        student_exists = row.get("student_exists", False)
+        completed = row.get("completed") or []
+
+    completed_set = set(completed)
+    checks = []
+    for course_code in course_codes:
+        if course_code not in table:
+            checks.append({
+                "student_id": student_id,
+                "course": course_code,
+                "required": [],
+                "completed": [],
+                "missing": [],
+                "can_take": False,
+                "reason": "course_not_found",
+            })
+            continue
+
+        required = sorted(table[course_code])
+
+        if not student_exists:
+            checks.append({
+                "student_id": student_id,
+                "course": course_code,
+                "required": required,
+                "completed": completed,
+                "missing": required,
+                "can_take": False,
+                "reason": "student_not_found",
+            })
+            continue
+
+        missing = [code for code in required if code not in completed_set]
+
+        checks.append({
             "student_id": student_id,
             "course": course_code,
             "required": required,
             "completed": completed,
-            "missing": required,
-            "can_take": False,
-            "reason": "student_not_found",
-        }
-
-    missing = sorted(list(set(required) - set(completed)))
+            "missing": missing,
+            "can_take": len(missing) == 0,
+            "reason": "ok" if len(missing) == 0 else "missing_prerequisites",
+        })
 
-    return {
-        "student_id": student_id,
-        "course": row["course"],
-        "required": required,
-        "completed": completed,
-        "missing": missing,
-        "can_take": len(missing) == 0,
-        "reason": "ok" if len(missing) == 0 else "missing_prerequisites",
-    }
+    return checks
 
 
 def validate_prerequisites_for_course(
@@ -172,16 +450,16 @@ def validate_prerequisites_for_course(
         - missing_prerequisites: List of missing prerequisite course codes
         - completed_courses: List of completed course codes (sorted)
     """
-    all_prereqs = get_all_prerequisites(target_course)
+    required = sorted(get_prerequisite_table().get(target_course, frozenset()))
 
-    required_set = set(all_prereqs)
+    # One pass over the sorted requirements keeps `missing` sorted too
     completed_set = set(completed_courses)
-    missing = sorted(list(required_set - completed_set))
+    missing = [code for code in required if code not in completed_set]
 
     return {
         "course": target_course,
         "can_take": len(missing) == 0,
-        "required_prerequisites": sorted(all_prereqs),
+        "required_prerequisites": required,
         "missing_prerequisites": missing,
         "completed_courses": sorted(completed_set),
     }
@@ -3,9 +3,9 @@ Schedule Optimization Service
 Uses topological sorting and semester constraints to create optimal course schedules
 """
 
-from typing import Any, List, Dict, Set, Union
-from collections import defaultdict, deque
-from backend.database.neo4j import get_neo4j_client
+from typing import Any, List, Dict, Tuple, Union
+from collections import deque
+from backend.database.neo4j import get_neo4j_client, singleton, timed_work
 from backend.models.schedule import (
     OptimizedScheduleResponse,
     SemesterSchedule,
@@ -45,54 +45,73 @@ class ScheduleOptimizerService:
         Returns:
             OptimizedScheduleResponse with semester-by-semester schedule
         """
+        # 1. Get student info and completed courses, 2. all available courses
+        # and their prerequisites, and 4. semester offerings: independent
+        # reads, run in one read transaction
         with self.driver.session() as session:
-            # 1. Get student info and completed courses
-            student_info = self._get_student_info(session, student_id)
-            completed_courses = student_info["completed"]
-
-            # 2. Get all available courses and their prerequisites
-            all_courses = self._get_all_courses_with_prereqs(session)
-
-            # 3. Filter out completed courses
-            remaining_courses = {
-                code: data
-                for code, data in all_courses.items()
-                if code not in completed_courses
-            }
-
-            # 4. Get semester offerings
-            semester_offerings = self._get_semester_offerings(
-                session, constraints.start_semester, constraints.target_semesters
+            student_info, all_courses, semester_offerings = session.execute_read(
+                timed_work("optimize_schedule", self._read_schedule_inputs),
+                student_id,
+                constraints.start_semester,
+                constraints.target_semesters,
             )
+        completed_courses = student_info["completed"]
+        completed_set = set(completed_courses)
+
+        # 3. Filter out completed courses
+        remaining_courses = {
+            code: data
+            for code, data in all_courses.items()
+            if code not in completed_set
+        }
 
-            # 5. Build prerequisite graph
-            prereq_graph = self._build_prereq_graph(remaining_courses, completed_courses)
+        # 5. Build prerequisite graph
+        prereq_graph = self._build_prereq_graph(remaining_courses, completed_courses)
 
-            # 6. Topologically sort courses
-            sorted_courses = self._topological_sort(
-                prereq_graph, remaining_courses, completed_courses
-            )
+        # 6. Topologically sort courses
+        sorted_courses = self._topological_sort(prereq_graph)
 
-            # 7. Assign courses to semesters
-            schedule = self._assign_courses_to_semesters(
-                sorted_courses,
-                remaining_courses,
-                semester_offerings,
-                constraints,
-                completed_courses,
-            )
+        # 7. Assign courses to semesters
+        schedule = self._assign_courses_to_semesters(
+            sorted_courses,
+            remaining_courses,
+            semester_offerings,
+            constraints,
+            prereq_graph,
+        )
 
-            # 8. Build response
-            return self._build_response(student_id, student_info, schedule, completed_courses)
+        # 8. Build response
+        return self._build_response(student_id, student_info, schedule, completed_courses)
+
+    def _read_schedule_inputs(
+        self, tx: Any, student_id: str, start_semester: str, num_semesters: int
+    ) -> Tuple[Dict[str, Any], Dict[str, Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Read everything the optimizer needs inside one read transaction.
+
+        Args:
+            tx: Neo4j managed transaction.
+            student_id: The student ID to plan for.
+            start_semester: Starting semester ID.
+            num_semesters: Number of semesters to retrieve.
+
+        Returns:
+            Tuple of (student info, all courses with prerequisites, semester offerings).
+        """
+        return (
+            self._get_student_info(tx, student_id),
+            self._get_all_courses_with_prereqs(tx),
+            self._get_semester_offerings(tx, start_semester, num_semesters),
+        )
 
     def _get_student_info(
-        self, session: Any, student_id: str
+        self, tx: Any, student_id: str
     ) -> Dict[str, Union[str, List[str], None]]:
         """
         Get student information and completed courses.
 
         Args:
-            session: Neo4j session object.
+            tx: Neo4j transaction (or session) to run the query on.
             student_id: The student ID to get information for.
 
         Returns:
@@ -105,7 +124,7 @@ class ScheduleOptimizerService:
                s.program as program,
                collect(c.code) as completed
         """
-        result = session.run(query, student_id=student_id)
+        result = tx.run(query, student_id=student_id)
         record = result.single()
 
         if not record:
@@ -118,13 +137,13 @@ class ScheduleOptimizerService:
         }
 
     def _get_all_courses_with_prereqs(
-        self, session: Any
+        self, tx: Any
     ) -> Dict[str, Dict[str, Union[str, int, List[str]]]]:
         """
         Get all courses with their prerequisites and metadata.
 
         Args:
-            session: Neo4j session object.
+            tx: Neo4j transaction (or session) to run the query on.
 
         Returns:
             Dictionary mapping course codes to their metadata (name, credits, prerequisites).
@@ -137,7 +156,7 @@ class ScheduleOptimizerService:
                c.credits as credits,
                collect(prereq.code) as prerequisites
         """
-        result = session.run(query)
+        result = tx.run(query)
 
         courses = {}
         for record in result:
@@ -150,22 +169,26 @@ class ScheduleOptimizerService:
         return courses
 
     def _get_semester_offerings(
-        self, session: Any, start_semester: str, num_semesters: int
+        self, tx: Any, start_semester: str, num_semesters: int
     ) -> List[Dict[str, Union[str, int]]]:
         """
         Get ordered list of semesters with course offerings.
 
         Args:
-            session: Neo4j session object.
+            tx: Neo4j transaction (or session) to run the query on.
             start_semester: Starting semester ID.
             num_semesters: Number of semesters to retrieve.
 
         Returns:
-            List of dictionaries containing semester information and course offerings.
+            List of dictionaries containing semester information and course
+            offerings (as a frozenset of course codes).
         """
+        # Semester IDs like FALL_2024 / SPRING_2025 do not sort chronologically
+        # as strings; resolve the start semester and compare on s.order instead.
         query = """
+        MATCH (start:Semester {id: $start_semester})
         MATCH (s:Semester)
-        WHERE s.id >= $start_semester
+        WHERE s.order >= start.order
         OPTIONAL MATCH (c:Course)-[:OFFERED_IN]->(s)
         WITH s, collect(c.code) as courses
         RETURN s.id as id,
@@ -177,7 +200,7 @@ class ScheduleOptimizerService:
         ORDER BY s.order
         LIMIT $num_semesters
         """
-        result = session.run(
+        result = tx.run(
             query, start_semester=start_semester, num_semesters=num_semesters
         )
 
@@ -190,7 +213,7 @@ class ScheduleOptimizerService:
                     "year": record["year"],
                     "term": record["term"],
                     "order": record["order"],
-                    "courses": [c for c in record["courses"] if c],
+                    "courses": frozenset(c for c in record["courses"] if c),
                 }
             )
 
@@ -198,87 +221,83 @@ class ScheduleOptimizerService:
 
     def _build_prereq_graph(
         self, courses: Dict[str, Dict], completed: List[str]
-    ) -> Dict[str, Set[str]]:
+    ) -> Tuple[List[str], List[int], List[int], List[int]]:
         """
         Build prerequisite dependency graph.
 
+        Courses are numbered and the "prereq -> dependent" edges are stored in
+        compressed sparse row form, so the topological sort runs on integer
+        lists instead of hashing course codes for every edge.
+
         Args:
             courses: Dictionary mapping course codes to course data.
             completed: List of completed course codes.
 
         Returns:
-            Dictionary mapping course codes to sets of courses that depend on them.
+            Tuple (codes, indptr, indices, in_degree): course codes by id; the
+            dependents of course i are indices[indptr[i]:indptr[i + 1]]; and
+            the number of uncompleted prerequisites of each course.
         """
-        graph = defaultdict(set)
-
-        for course_code, course_data in courses.items():
-            prereqs = course_data["prerequisites"]
-
-            # Filter prerequisites to only include uncompleted ones
-            uncompleted_prereqs = [
-                p for p in prereqs if p not in completed and p in courses
-            ]
-
-            # Add edges: prereq -> course
-            for prereq in uncompleted_prereqs:
-                graph[prereq].add(course_code)
-
-            # Ensure all courses are in the graph
-            if course_code not in graph:
-                graph[course_code] = set()
-
-        return graph
+        completed_set = set(completed)
+        codes = list(courses)
+        code_to_id = {code: i for i, code in enumerate(codes)}
+
+        dependents: List[List[int]] = [[] for _ in codes]
+        in_degree = [0] * len(codes)
+        for i, code in enumerate(codes):
+            for prereq in courses[code]["prerequisites"]:
+                # Only uncompleted prerequisites that still need scheduling
+                j = code_to_id.get(prereq)
+                if j is not None and prereq not in completed_set:
+                    dependents[j].append(i)
+                    in_degree[i] += 1
+
+        indptr = [0]
+        indices: List[int] = []
+        for targets in dependents:
+            indices.extend(targets)
+            indptr.append(len(indices))
+
+        return codes, indptr, indices, in_degree
 
     def _topological_sort(
-        self,
-        graph: Dict[str, Set[str]],
-        courses: Dict[str, Dict],
-        completed: List[str],
+        self, graph: Tuple[List[str], List[int], List[int], List[int]]
     ) -> List[str]:
         """
         Topological sort using Kahn's algorithm.
 
         Args:
-            graph: Prerequisite dependency graph.
-            courses: Dictionary mapping course codes to course data.
-            completed: List of completed course codes.
+            graph: Prerequisite dependency graph from _build_prereq_graph.
 
         Returns:
             List of course codes in topological order (prerequisites first).
         """
-        # Calculate in-degree (number of prerequisites) for each course
-        in_degree = defaultdict(int)
-        for course_code in courses.keys():
-            prereqs = courses[course_code]["prerequisites"]
-            # Only count uncompleted prerequisites
-            uncompleted_prereqs = [
-                p for p in prereqs if p not in completed and p in courses
-            ]
-            in_degree[course_code] = len(uncompleted_prereqs)
+        codes, indptr, indices, in_degree = graph
+        in_degree = list(in_degree)
 
         # Queue of courses with no prerequisites
-        queue = deque([course for course, degree in in_degree.items() if degree == 0])
+        queue = deque(i for i, degree in enumerate(in_degree) if degree == 0)
 
-        sorted_courses = []
+        order = []
 
         while queue:
             course = queue.popleft()
-            sorted_courses.append(course)
+            order.append(course)
 
             # Reduce in-degree for dependent courses
-            for dependent in graph[course]:
+            for dependent in indices[indptr[course]:indptr[course + 1]]:
                 in_degree[dependent] -= 1
                 if in_degree[dependent] == 0:
                     queue.append(dependent)
 
         # Check for cycles (courses not included in sort)
-        if len(sorted_courses) != len(courses):
+        if len(order) != len(codes):
             # Some courses couldn't be sorted (cycle detected)
             # Add remaining courses anyway
-            remaining = set(courses.keys()) - set(sorted_courses)
-            sorted_courses.extend(remaining)
+            placed = set(order)
+            order.extend(i for i in range(len(codes)) if i not in placed)
 
-        return sorted_courses
+        return [codes[i] for i in order]
 
     # pylint: disable=too-many-arguments,too-many-positional-arguments,too-many-locals
     def _assign_courses_to_semesters(
@@ -287,51 +306,53 @@ class ScheduleOptimizerService:
         courses: Dict[str, Dict],
         semesters: List[Dict],
         constraints: ScheduleConstraints,
-        completed: List[str],
+        graph: Tuple[List[str], List[int], List[int], List[int]],
     ) -> List[SemesterSchedule]:
         """
         Assign courses to semesters respecting constraints.
 
+        Keeps a ready set of courses whose prerequisites are all taken,
+        updated through the graph's in-degrees as courses are placed, so each
+        semester only looks at ready courses instead of rescanning the whole
+        remaining catalog.
+
         Args:
             sorted_courses: List of course codes in topological order.
             courses: Dictionary mapping course codes to course data.
             semesters: List of semester dictionaries with offerings.
             constraints: Schedule constraints (max courses, credits, etc.).
-            completed: List of completed course codes.
+            graph: Prerequisite dependency graph from _build_prereq_graph.
 
         Returns:
             List of SemesterSchedule objects with assigned courses.
         """
+        codes, indptr, indices, in_degree = graph
+        code_to_id = {code: i for i, code in enumerate(codes)}
+        rank = [0] * len(codes)
+        for position, course_code in enumerate(sorted_courses):
+            rank[code_to_id[course_code]] = position
+
+        waiting = list(in_degree)
+        ready = {i for i, degree in enumerate(waiting) if degree == 0}
+
         schedule = []
-        courses_taken = set(completed)
 
         for semester in semesters:
             semester_courses = []
             semester_credits = 0
 
-            # Available courses for this semester
-            courses_to_consider = []
-
-            for course_code in sorted_courses:
-                if course_code in courses_taken:
-                    continue
-
-                course_data = courses[course_code]
-
-                # Check if course is offered this semester
-                if course_code not in semester["courses"]:
-                    continue
-
-                # Check if all prerequisites are met
-                prereqs = course_data["prerequisites"]
-                if all(p in courses_taken or p in completed for p in prereqs):
-                    courses_to_consider.append(course_code)
+            # Available courses for this semester: ready and offered, in
+            # topological order
+            offered = {code_to_id[c] for c in semester["courses"] if c in code_to_id}
+            courses_to_consider = sorted(ready & offered, key=rank.__getitem__)
 
             # Add courses up to constraints
-            for course_code in courses_to_consider:
+            placed = []
+            for course_id in courses_to_consider:
                 if len(semester_courses) >= constraints.max_courses_per_semester:
                     break
 
+                course_code = codes[course_id]
                 course_data = courses[course_code]
                 course_credits = course_data["credits"]
 
@@ -347,7 +368,15 @@ class ScheduleOptimizerService:
                     )
                 )
                 semester_credits += course_credits
-                courses_taken.add(course_code)
+                placed.append(course_id)
+
+            # Courses taken this semester unlock their dependents from the next one
+            for course_id in placed:
+                ready.discard(course_id)
+                for dependent in indices[indptr[course_id]:indptr[course_id + 1]]:
+                    waiting[dependent] -= 1
+                    if waiting[dependent] == 0:
+                        ready.add(dependent)
 
             # Create semester schedule
             schedule.append(
@@ -406,14 +435,7 @@ class ScheduleOptimizerService:
         )
 
 
-# Singleton instance
-_SCHEDULE_OPTIMIZER_SERVICE = None
-
-
+@singleton
 def get_schedule_optimizer_service() -> ScheduleOptimizerService:
     """Get or create schedule optimizer service instance"""
-    # pylint: disable=global-statement
-    global _SCHEDULE_OPTIMIZER_SERVICE
-    if _SCHEDULE_OPTIMIZER_SERVICE is None:
-        _SCHEDULE_OPTIMIZER_SERVICE = ScheduleOptimizerService()
-    return _SCHEDULE_OPTIMIZER_SERVICE
+    return ScheduleOptimizerService()
@@ -5,20 +5,75 @@ Main FastAPI application for managing course prerequisites, student eligibility,
 degree planning, and schedule optimization using Neo4j graph database.
 """
 
-from typing import Dict, List, Union
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Union
 
-from fastapi import FastAPI, HTTPException
+import orjson
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import JSONResponse
+from neo4j import RoutingControl
 from pydantic import BaseModel
 
-from backend.database.neo4j import get_neo4j_client
+from backend.database.neo4j import (
+    NEO4J_UNAVAILABLE_ERRORS,
+    close_neo4j_sessions,
+    get_neo4j_database,
+    get_neo4j_driver,
+    get_read_executor,
+    warm_page_cache,
+)
 from backend.services import prerequisites as prereq_service
 from backend.routes import eligibility
 from backend.routes.degree_planner import router as degree_planner_router
 from backend.routes.graduation_paths import router as paths_router
 from backend.routes import schedule_optimizer
 from backend.routes.advanced_queries import router as advanced_queries_router
+from backend.routes.admin import router as admin_router
 
-app = FastAPI(title="Course Prerequisite Planner")
+
+class OrjsonResponse(JSONResponse):
+    """JSON response rendered with orjson, which is much faster on large nested payloads."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    """
+    Warm Neo4j's page cache and load the in-memory prerequisite table in the
+    background on startup, and release pooled Neo4j sessions when the
+    application shuts down.
+    """
+    get_read_executor().submit(warm_page_cache)
+    get_read_executor().submit(prereq_service.get_prerequisite_table)
+    yield
+    close_neo4j_sessions()
+
+
+app = FastAPI(
+    title="Course Prerequisite Planner",
+    default_response_class=OrjsonResponse,
+    lifespan=lifespan,
+)
+
+
+async def neo4j_unavailable_handler(_request: Request, exc: Exception) -> JSONResponse:
+    """
+    Answer 503 with Retry-After when Neo4j is temporarily unavailable.
+
+    The driver has already retried transient failures inside managed
+    transactions, so the client is asked to back off instead of getting a 500.
+    """
+    return OrjsonResponse(
+        status_code=503,
+        content={"detail": f"Neo4j temporarily unavailable: {exc}"},
+        headers={"Retry-After": "1"},
+    )
+
+
+for _error in NEO4J_UNAVAILABLE_ERRORS:
+    app.add_exception_handler(_error, neo4j_unavailable_handler)
 
 
 @app.get("/")
@@ -42,12 +97,18 @@ def health_check() -> Dict[str, Union[str, bool]]:
     """
     Health check endpoint to verify API and Neo4j connectivity.
 
+    Goes straight to the shared driver so the probe is never answered from
+    the query cache; an unreachable server surfaces as a 503.
+
     Returns:
         Dictionary with status and Neo4j connection status.
     """
-    client = get_neo4j_client()
-    result = client.query("RETURN 1 AS ok")
-    return {"status": "ok", "neo4j_ok": result[0]["ok"] == 1}
+    records, _, _ = get_neo4j_driver().execute_query(
+        "RETURN 1 AS ok",
+        database_=get_neo4j_database(),
+        routing_=RoutingControl.READ,
+    )
+    return {"status": "ok", "neo4j_ok": records[0]["ok"] == 1}
 
 
 @app.get("/courses/{course_code}/prerequisites")
@@ -63,7 +124,8 @@ def get_course_prereqs(course_code: str, all: bool = True) -> Dict[str, Union[st
         Dictionary containing course code, prerequisites list, and mode (all/direct).
     """
     if all:
-        prereqs = prereq_service.get_all_prerequisites(course_code)
+        # served from the in-memory transitive table; no traversal per request
+        prereqs = sorted(prereq_service.get_prerequisite_table().get(course_code, ()))
     else:
         prereqs = prereq_service.get_direct_prerequisites(course_code)
 
@@ -115,6 +177,30 @@ def can_student_take(student_id: str, course_code: str) -> Dict:
     return result
 
 
+class CanTakeBatchRequest(BaseModel):
+    """Request model for checking several courses for one student."""
+
+    course_codes: List[str]
+
+
+@app.post("/students/{student_id}/can_take")
+def can_student_take_batch(student_id: str, payload: CanTakeBatchRequest) -> List[Dict]:
+    """
+    Check whether a student can take each of several courses.
+
+    Args:
+        student_id: The student ID to check.
+        payload: CanTakeBatchRequest listing the course codes to check.
+
+    Returns:
+        One eligibility dictionary per course, in request order; unknown
+        courses are reported with reason "course_not_found".
+    """
+    return prereq_service.check_student_can_take_batch(
+        student_id=student_id, course_codes=payload.course_codes
+    )
+
+
 class ValidationRequest(BaseModel):
     """Request model for prerequisite validation."""
 
@@ -145,4 +231,5 @@ app.include_router(degree_planner_router)
 app.include_router(paths_router)
 app.include_router(schedule_optimizer.router)
 app.include_router(advanced_queries_router)
+app.include_router(admin_router)
 
@@ -0,0 +1,17 @@
+// PageRank, persisted: compute once after the graph changes, then read the
+// stored scores instead of re-running the algorithm on every request.
+// Requires the 'courseGraph' projection (project_graph.cypher).
+CALL gds.pageRank.write('courseGraph', {writeProperty: 'pagerank'})
+YIELD nodePropertiesWritten, ranIterations;
+
+// Range index so the top-N read below is an index-ordered lookup
+CREATE RANGE INDEX course_pagerank_index IF NOT EXISTS
+FOR (c:Course)
+ON (c.pagerank);
+
+// Top courses by stored PageRank
+MATCH (c:Course)
+WHERE c.pagerank IS NOT NULL
+RETURN c.code AS course, c.pagerank AS score
+ORDER BY c.pagerank DESC
+LIMIT 10;
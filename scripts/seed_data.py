@@ -14,17 +14,22 @@ Seed script for importing course prerequisites into Neo4j.
 - Creates:
     (:Course {code}) nodes
     (:Course {code: prereq})-[:PRE_REQUIRES]->(:Course {code: course}) relationships
+
+With --bulk, the CSV is instead converted to neo4j-admin import files and
+loaded offline into an empty (stopped) database.
 """
 
 from __future__ import annotations
 
 import csv
 import os
+import subprocess
 import sys
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List
+from typing import Iterator, List, Set, Tuple
 
-from neo4j import GraphDatabase, Driver
+from neo4j import GraphDatabase, Driver, Session
 
 
 
@@ -53,7 +58,20 @@ def get_driver() -> Driver:
     return driver
 
 
-def run_query(driver: Driver, cypher: str, parameters: dict | None = None) -> None:
+@contextmanager
+def seed_session(driver: Driver) -> Iterator[Session]:
+    """
+    Open one session on NEO4J_DATABASE for a whole seeding run.
+
+    Every write of the run goes through this session, so the session is
+    acquired once instead of once per statement.
+    """
+    database_name = os.getenv("NEO4J_DATABASE", "neo4j")
+    with driver.session(database=database_name) as session:
+        yield session
+
+
+def run_query(session: Session, cypher: str, parameters: dict | None = None) -> None:
     """
     Helper to run a write query with basic error handling.
     
@@ -61,10 +79,8 @@ def run_query(driver: Driver, cypher: str, parameters: dict | None = None) -> No
     """
     parameters = parameters or {}
     try:
-        database_name = os.getenv("NEO4J_DATABASE", "neo4j")
-        with driver.session(database=database_name) as session:
-            # execute_write runs the query in a write transaction
-            session.execute_write(lambda tx: tx.run(cypher, **parameters))
+        # execute_write runs the query in a write transaction
+        session.execute_write(lambda tx: tx.run(cypher, **parameters))
     except Exception as exc:
         # Convert any error to a more helpful message
         raise RuntimeError(f"Neo4j query failed: {exc}") from exc
@@ -73,11 +89,10 @@ def run_query(driver: Driver, cypher: str, parameters: dict | None = None) -> No
 # schema: constraints & indexes
 
 
-def create_constraints_and_indexes(driver: Driver) -> None:
+def create_constraints_and_indexes(session: Session) -> None:
     """
-    Create constraints and indexes for Course nodes.
-
-    You can expand this later with more labels/indexes if needed.
+    Create constraints and indexes for the Course, Student, Degree and
+    Semester lookups the API runs on every request.
     """
     print("🔧 Creating constraints and indexes (IF NOT EXISTS)...")
 
@@ -94,10 +109,41 @@ def create_constraints_and_indexes(driver: Driver) -> None:
         FOR (c:Course)
         ON (c.name)
         """,
+        # unique constraint on Student.id (advanced queries, schedule optimizer)
+        """
+        CREATE CONSTRAINT student_id_unique IF NOT EXISTS
+        FOR (s:Student)
+        REQUIRE s.id IS UNIQUE
+        """,
+        # index on Student.student_id (eligibility, degree planner, enrollments)
+        """
+        CREATE INDEX student_student_id_index IF NOT EXISTS
+        FOR (s:Student)
+        ON (s.student_id)
+        """,
+        # unique constraint on Degree.id (degree requirement lookups in the
+        # degree planner and graduation paths match on Degree.id)
+        """
+        CREATE CONSTRAINT degree_id_unique IF NOT EXISTS
+        FOR (d:Degree)
+        REQUIRE d.id IS UNIQUE
+        """,
+        # unique constraint on Semester.id
+        """
+        CREATE CONSTRAINT semester_id_unique IF NOT EXISTS
+        FOR (s:Semester)
+        REQUIRE s.id IS UNIQUE
+        """,
+        # range index on Semester.order (semester listings sort and filter on it)
+        """
+        CREATE RANGE INDEX semester_order_index IF NOT EXISTS
+        FOR (s:Semester)
+        ON (s.order)
+        """,
     ]
 
     for cypher in queries:
-        run_query(driver, cypher)
+        run_query(session, cypher)
 
     print("✅ Constraints and indexes created.\n")
 
@@ -107,134 +153,244 @@ def create_constraints_and_indexes(driver: Driver) -> None:
 
 
 
-def parse_prereqs_row(row: dict) -> List[str]:
+def parse_prereqs_row(row: List[str]) -> List[str]:
     """
-    Given a dict row from csv.DictReader with columns:
+    Given a row from csv.reader with columns:
         Course, PrerequisiteNumber, 0,1,2,...,9
 
     Return the list of prerequisite course codes (non-empty, stripped).
     """
     # how many prerequisites are declared
-    count_raw = (row.get("PrerequisiteNumber") or "").strip()
+    count_raw = row[1].strip() if len(row) > 1 else ""
     try:
         prereq_count = int(count_raw) if count_raw else 0
     except ValueError:
         prereq_count = 0
 
-    prereqs: List[str] = []
+    # non-empty codes from columns 0..prereq_count-1, deduplicated in order
+    codes = (code.strip() for code in row[2:2 + max(prereq_count, 0)])
+    return list(dict.fromkeys(code for code in codes if code))
+
 
-    # Columns 
-    for i in range(prereq_count):
-        col_name = str(i)
-        code = (row.get(col_name) or "").strip()
-        if code:
-            prereqs.append(code)
+# rows per UNWIND batch (one write transaction each)
+BATCH_SIZE = 10_000
 
-    # deduplicate while preserving order
-    seen = set()
-    unique_prereqs: List[str] = []
-    for code in prereqs:
-        if code not in seen:
-            seen.add(code)
-            unique_prereqs.append(code)
+# batched write statements; kept as constants so every batch sends the same
+# query text and hits Neo4j's plan cache
+MERGE_COURSES = """
+UNWIND $codes AS code
+MERGE (c:Course {code: code})
+ON CREATE SET c.name = code
+"""
 
-    return unique_prereqs
+MERGE_PREREQ_EDGES = """
+UNWIND $rows AS r
+MATCH (p:Course {code: r.pr})
+MATCH (c:Course {code: r.co})
+MERGE (p)-[:PRE_REQUIRES]->(c)
+"""
 
 
-def import_courses_from_csv(driver: Driver, csv_path: Path) -> None:
+def write_course_batch(
+    session: Session, course_codes: List[str], edge_rows: List[dict]
+) -> None:
     """
-    Read the CSV file and create Course nodes and PRE_REQUIRES relationships.
+    Write one batch of Course nodes and PRE_REQUIRES relationships.
 
-    For each row:
-        - MERGE (:Course {code: course_code})
-        - for each prereq_code:
-            MERGE (:Course {code: prereq_code})
-            MERGE (prereq)-[:PRE_REQUIRES]->(course)
+    Both statements run with UNWIND inside a single write transaction, so a
+    batch costs one commit instead of one per node or relationship.
+    """
+
+    def write(tx) -> None:
+        tx.run(MERGE_COURSES, codes=course_codes)
+        tx.run(MERGE_PREREQ_EDGES, rows=edge_rows)
+
+    try:
+        session.execute_write(write)
+    except Exception as exc:
+        raise RuntimeError(f"Neo4j query failed: {exc}") from exc
+
+
+def iter_course_rows(csv_path: Path) -> Iterator[Tuple[str, List[str]]]:
+    """
+    Yield (course_code, prerequisite_codes) for every course row of the CSV.
     """
     if not csv_path.exists():
         raise FileNotFoundError(f"CSV file not found: {csv_path}")
 
     print(f"Loading CSV: {csv_path}")
 
-    created_courses = 0
-    created_rel = 0
-
     with csv_path.open("r", encoding="utf-8-sig", newline="") as f:
-        reader = csv.DictReader(f)
+        # rows are read positionally; no dict is built per row
+        reader = csv.reader(f)
 
         # safety check on header
         expected_prefix = ["Course", "PrerequisiteNumber"]
-        header = reader.fieldnames or []
-        if not all(col in header for col in expected_prefix):
+        header = next(reader, [])
+        if [col.strip() for col in header[:2]] != expected_prefix:
             raise ValueError(
-                f"CSV header does not contain required columns {expected_prefix}. "
+                f"CSV header does not start with required columns {expected_prefix}. "
                 f"Found: {header}"
             )
 
         for row in reader:
-            course_code = (row.get("Course") or "").strip()
-            if not course_code:
-                continue
-
-            # create and merge the course node itself
-            run_query(
-                driver,
-                """
-                MERGE (c:Course {code: $code})
-                ON CREATE SET c.name = $code
-                """,
-                {"code": course_code},
-            )
-            created_courses += 1
-
-            prereq_codes = parse_prereqs_row(row)
-            if not prereq_codes:
-                continue
-
-            for prereq_code in prereq_codes:
-                # merge ensures the prerequisite course exists and creates if it doesn't exist
-                run_query(
-                    driver,
-                    """
-                    MERGE (p:Course {code: $pr_code})
-                    ON CREATE SET p.name = $pr_code
-                    """,
-                    {"pr_code": prereq_code},
-                )
-
-                # create the relationship: prerequisite -[:PRE_REQUIRES]-> course
-                # merge ensures we don't create duplicate relationships
-                run_query(
-                    driver,
-                    """
-                    MATCH (p:Course {code: $pr_code})
-                    MATCH (c:Course {code: $course_code})
-                    MERGE (p)-[:PRE_REQUIRES]->(c)
-                    """,
-                    {"pr_code": prereq_code, "course_code": course_code},
-                )
-                created_rel += 1
-
-    print(f"Import finished")
+            course_code = row[0].strip() if row else ""
+            if course_code:
+                yield course_code, parse_prereqs_row(row)
+
+
+def import_courses_from_csv(session: Session, csv_path: Path) -> None:
+    """
+    Read the CSV file and create Course nodes and PRE_REQUIRES relationships.
+
+    Rows are accumulated and written in batches of BATCH_SIZE:
+        - MERGE (:Course {code}) for every course and prerequisite code
+        - MERGE (prereq)-[:PRE_REQUIRES]->(course) for every prerequisite
+    """
+    created_courses = 0
+    created_rel = 0
+
+    # codes already MERGEd by an earlier batch; each code is sent only once
+    # per file, and later edges just MATCH it
+    written: Set[str] = set()
+    # course codes are kept in a dict to dedupe them while preserving order
+    course_codes: dict = {}
+    edge_rows: List[dict] = []
+
+    for course_code, prereq_codes in iter_course_rows(csv_path):
+        if course_code not in written:
+            course_codes[course_code] = None
+        created_courses += 1
+
+        # prerequisite -[:PRE_REQUIRES]-> course; both endpoints are
+        # merged in this or an earlier batch before the relationship
+        for prereq_code in prereq_codes:
+            if prereq_code not in written:
+                course_codes[prereq_code] = None
+            edge_rows.append({"pr": prereq_code, "co": course_code})
+            created_rel += 1
+
+        if len(course_codes) + len(edge_rows) >= BATCH_SIZE:
+            write_course_batch(session, list(course_codes), edge_rows)
+            written.update(course_codes)
+            course_codes = {}
+            edge_rows = []
+
+    if course_codes or edge_rows:
+        write_course_batch(session, list(course_codes), edge_rows)
+
+    # the materialized closure and bottleneck metrics are stale now; dropping
+    # them makes the API fall back to traversal until /admin/prerequisites/rebuild
+    # (stored PageRank scores are rewritten by scripts/gds/pagerank_write.cypher)
+    run_query(
+        session,
+        """
+        MATCH (c:Course)
+        REMOVE c.prereq_set, c.prereq_depth, c.unlocks_count, c.prereqs_within_3, c.pagerank
+        """,
+    )
+
+    print("Import finished")
     print(f"   Courses processed: {created_courses}")
     print(f"   PRE_REQUIRES relationships created: {created_rel}\n")
 
 
 
+# offline bulk import (neo4j-admin)
+
+
+def emit_admin_csvs(csv_path: Path, out_dir: Path) -> Tuple[Path, Path]:
+    """
+    Convert the prerequisite CSV into neo4j-admin import files:
+
+        courses_nodes.csv   code:ID(Course),name
+        prereq_rels.csv     :START_ID(Course),:END_ID(Course),:TYPE
+
+    Nodes and relationships are deduplicated, since neo4j-admin would
+    otherwise reject repeated ids and create parallel relationships.
+    """
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    # dicts dedupe while preserving CSV order
+    course_codes: dict = {}
+    edges: dict = {}
+    for course_code, prereq_codes in iter_course_rows(csv_path):
+        course_codes[course_code] = None
+        for prereq_code in prereq_codes:
+            course_codes[prereq_code] = None
+            edges[(prereq_code, course_code)] = None
+
+    nodes_path = out_dir / "courses_nodes.csv"
+    with nodes_path.open("w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["code:ID(Course)", "name"])
+        writer.writerows((code, code) for code in course_codes)
+
+    rels_path = out_dir / "prereq_rels.csv"
+    with rels_path.open("w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow([":START_ID(Course)", ":END_ID(Course)", ":TYPE"])
+        writer.writerows((pr, co, "PRE_REQUIRES") for pr, co in edges)
+
+    print(f"   Courses written: {len(course_codes)}")
+    print(f"   PRE_REQUIRES relationships written: {len(edges)}\n")
+    return nodes_path, rels_path
+
+
+def bulk_import(csv_path: Path, out_dir: Path) -> None:
+    """
+    Load the CSV into an empty database with `neo4j-admin database import full`.
+
+    This bypasses the transaction log and query engine, so it must run where
+    neo4j-admin is installed (NEO4J_ADMIN, default: neo4j-admin) while the
+    target database (NEO4J_DATABASE) is stopped. The database is overwritten.
+    """
+    nodes_path, rels_path = emit_admin_csvs(csv_path, out_dir)
+
+    command = [
+        os.getenv("NEO4J_ADMIN", "neo4j-admin"),
+        "database",
+        "import",
+        "full",
+        os.getenv("NEO4J_DATABASE", "neo4j"),
+        f"--nodes=Course={nodes_path}",
+        f"--relationships={rels_path}",
+        "--overwrite-destination",
+    ]
+    print(f" Running: {' '.join(command)}")
+    subprocess.run(command, check=True)
+
+
+
 # main entrypoint
 
 def main() -> None:
     """
     Usage:
         python scripts/seed_data.py [path_to_csv]
+        python scripts/seed_data.py --bulk [path_to_csv]
+        python scripts/seed_data.py --schema-only
 
     Example:
         python scripts/seed_data.py data/courses_prerequisites.csv
+
+    --bulk loads an empty, stopped database with neo4j-admin; start Neo4j
+    afterwards and run --schema-only to create the constraints and indexes.
     """
+    args = sys.argv[1:]
+    bulk = "--bulk" in args
+    schema_only = "--schema-only" in args
+    positional = [arg for arg in args if not arg.startswith("--")]
+
     # default csv location
     default_path = Path("data") / "courses_prerequisites.csv"
-    csv_arg = sys.argv[1] if len(sys.argv) > 1 else str(default_path)
-    csv_path = Path(csv_arg)
+    csv_path = Path(positional[0] if positional else str(default_path))
+
+    if bulk:
+        print(" Starting neo4j-admin bulk import...")
+        bulk_import(csv_path, Path(os.getenv("NEO4J_IMPORT_DIR", "import")))
+        print(" Bulk import finished; start Neo4j and run with --schema-only.")
+        return
 
     print(" Starting Neo4j seed script...")
 
@@ -244,8 +400,10 @@ def main() -> None:
         driver.verify_connectivity()
         print(" connected to Neo4j successfully.\n")
 
-        create_constraints_and_indexes(driver)
-        import_courses_from_csv(driver, csv_path)
+        with seed_session(driver) as session:
+            create_constraints_and_indexes(session)
+            if not schema_only:
+                import_courses_from_csv(session, csv_path)
 
     finally:
         driver.close()
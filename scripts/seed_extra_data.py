@@ -12,8 +12,11 @@ and uses the same Neo4j driver logic.
 from __future__ import annotations
 import csv
 import os
+import re
+from contextlib import contextmanager
+from itertools import islice
 from pathlib import Path
-from neo4j import GraphDatabase
+from neo4j import GraphDatabase, RoutingControl
 
 
 # --------------------------------------------------------------
@@ -27,106 +30,159 @@ def get_driver():
     return GraphDatabase.driver(uri, auth=(user, password))
 
 
-def run_write(driver, cypher: str, params: dict = None):
-    params = params or {}
+# Rows per UNWIND statement (one write transaction each)
+BATCH_SIZE = 10_000
+
+# First run of digits in a course code, i.e. its level ("CS 101" -> 101)
+LEVEL_RE = re.compile(r"(\d+)")
+
+# Batched UNWIND statements; kept as constants so every batch sends the
+# same query text and hits Neo4j's plan cache
+MERGE_DEGREES = """
+UNWIND $rows AS r
+MERGE (d:Degree {id: r.degree_id})
+SET d.name = r.degree_name,
+    d.subject_prefix = r.subject_prefix,
+    d.description = r.description
+"""
+
+MERGE_DEGREE_REQUIREMENTS = """
+UNWIND $rows AS r
+MATCH (d:Degree {id: r.degree_id})
+MERGE (c:Course {code: r.course})
+MERGE (c)-[:REQUIRED_FOR]->(d)
+"""
+
+MERGE_STUDENTS = """
+UNWIND $rows AS r
+MERGE (s:Student {student_id: r.student_id})
+SET s.name = r.name,
+    s.year = r.year,
+    s.profile = r.profile
+WITH s, r
+MATCH (d:Degree {id: r.degree_id})
+MERGE (s)-[:ENROLLED_IN]->(d)
+"""
+
+MERGE_ENROLLMENTS = """
+UNWIND $rows AS r
+MATCH (s:Student {student_id: r.student_id})
+MERGE (c:Course {code: r.course})
+MERGE (s)-[:HAS_COMPLETED]->(c)
+"""
+
+MERGE_OFFERINGS = """
+UNWIND $rows AS p
+MATCH (c:Course {code: p.co})
+MATCH (s:Semester {id: p.se})
+MERGE (c)-[:OFFERED_IN]->(s)
+"""
+
+
+@contextmanager
+def seed_session(driver):
+    """
+    Open one session on NEO4J_DATABASE, shared by every write of a run.
+    """
     db = os.getenv("NEO4J_DATABASE", "neo4j")
     with driver.session(database=db) as session:
-        session.execute_write(lambda tx: tx.run(cypher, **params))
+        yield session
+
+
+def run_write(session, cypher: str, params: dict = None):
+    params = params or {}
+    session.execute_write(lambda tx: tx.run(cypher, **params))
+
+
+def batched(iterable, size: int):
+    """
+    Yield lists of up to `size` items, consuming the iterable lazily.
+    """
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def run_write_batches(session, cypher: str, rows) -> int:
+    """
+    Run an `UNWIND $rows AS r ...` statement over rows, BATCH_SIZE at a time.
+
+    Rows may be any iterable (e.g. a csv.DictReader or a generator); only one
+    batch is held in memory. Returns the number of rows written.
+    """
+    written = 0
+    for batch in batched(rows, BATCH_SIZE):
+        run_write(session, cypher, {"rows": batch})
+        written += len(batch)
+    return written
+
+
+# --------------------------------------------------------------
+# SCHEMA
+# --------------------------------------------------------------
+
+def create_constraints(session):
+    """
+    Create the constraints/indexes the imports below MERGE and MATCH on, so
+    each lookup is an index seek instead of a label scan. Names match
+    seed_data.py, so running both scripts is safe.
+    """
+    print("Creating constraints and indexes (IF NOT EXISTS)...")
+    queries = [
+        # Degree.id is the only degree key: the MERGEs below and the degree
+        # planner's requirement lookup all match on it
+        """
+        CREATE CONSTRAINT degree_id_unique IF NOT EXISTS
+        FOR (d:Degree) REQUIRE d.id IS UNIQUE
+        """,
+        """
+        CREATE INDEX student_student_id_index IF NOT EXISTS
+        FOR (s:Student) ON (s.student_id)
+        """,
+        """
+        CREATE CONSTRAINT semester_id_unique IF NOT EXISTS
+        FOR (s:Semester) REQUIRE s.id IS UNIQUE
+        """,
+        """
+        CREATE CONSTRAINT course_code_unique IF NOT EXISTS
+        FOR (c:Course) REQUIRE c.code IS UNIQUE
+        """,
+    ]
+    for cypher in queries:
+        run_write(session, cypher)
+    print("✔ Constraints and indexes created.\n")
 
 
 # --------------------------------------------------------------
 # IMPORT FUNCTIONS
 # --------------------------------------------------------------
 
-def import_degrees(driver, csv_path: Path):
+def import_degrees(session, csv_path: Path):
     print(f"Importing degrees from: {csv_path}")
     with csv_path.open("r", encoding="utf-8-sig") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            run_write(
-                driver,
-                """
-                MERGE (d:Degree {id: $id})
-                SET d.degree_id = $id,
-                    d.name = $name,
-                    d.subject_prefix = $prefix,
-                    d.description = $desc
-                """,
-                {
-                    "id": row["degree_id"],
-                    "name": row["degree_name"],
-                    "prefix": row["subject_prefix"],
-                    "desc": row["description"],
-                }
-            )
+        run_write_batches(session, MERGE_DEGREES, csv.DictReader(f))
     print("✔ Degrees imported.\n")
 
 
-def import_degree_requirements(driver, csv_path: Path):
+def import_degree_requirements(session, csv_path: Path):
     print(f"Importing degree requirements from: {csv_path}")
     with csv_path.open("r", encoding="utf-8-sig") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            run_write(
-                driver,
-                """
-                MATCH (d:Degree {id: $degree})
-                MERGE (c:Course {code: $course})
-                MERGE (c)-[:REQUIRED_FOR]->(d)
-                """,
-                {"degree": row["degree_id"], "course": row["course"]}
-            )
+        run_write_batches(session, MERGE_DEGREE_REQUIREMENTS, csv.DictReader(f))
     print("✔ Degree requirements imported.\n")
 
 
-def import_students(driver, csv_path: Path):
+def import_students(session, csv_path: Path):
     print(f"Importing students from: {csv_path}")
     with csv_path.open("r", encoding="utf-8-sig") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            run_write(
-                driver,
-                """
-                MERGE (s:Student {student_id: $sid})
-                SET s.name = $name,
-                    s.year = $year,
-                    s.profile = $profile
-                """,
-                {
-                    "sid": row["student_id"],
-                    "name": row["name"],
-                    "year": row["year"],
-                    "profile": row["profile"],
-                }
-            )
-
-            # Enroll student in degree
-            run_write(
-                driver,
-                """
-                MATCH (s:Student {student_id: $sid})
-                MATCH (d:Degree {id: $degree})
-                MERGE (s)-[:ENROLLED_IN]->(d)
-                """,
-                {"sid": row["student_id"], "degree": row["degree_id"]}
-            )
+        # Create the student, then enroll them in their degree
+        run_write_batches(session, MERGE_STUDENTS, csv.DictReader(f))
     print("✔ Students imported.\n")
 
 
-def import_student_enrollments(driver, csv_path: Path):
+def import_student_enrollments(session, csv_path: Path):
     print(f"Importing student enrollments from: {csv_path}")
     with csv_path.open("r", encoding="utf-8-sig") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            run_write(
-                driver,
-                """
-                MATCH (s:Student {student_id: $sid})
-                MERGE (c:Course {code: $course})
-                MERGE (s)-[:HAS_COMPLETED]->(c)
-                """,
-                {"sid": row["student_id"], "course": row["course"]}
-            )
+        run_write_batches(session, MERGE_ENROLLMENTS, csv.DictReader(f))
     print("✔ Enrollments imported.\n")
 
 def create_semesters_and_offerings(driver):
@@ -157,39 +213,47 @@ def create_semesters_and_offerings(driver):
             }
         ])
     
-    # Create Semester nodes
-    with driver.session() as session:
-        # Create constraint on semester ID
-        try:
-            session.run("""
-                CREATE CONSTRAINT semester_id_unique IF NOT EXISTS
-                FOR (s:Semester) REQUIRE s.id IS UNIQUE
-            """)
-        except Exception as e:
-            print(f"Constraint may already exist: {e}")
-        
-        # Create semester nodes
-        session.run("""
-            UNWIND $semesters AS semester
-            MERGE (s:Semester {id: semester.id})
-            SET s.name = semester.name,
-                s.year = semester.year,
-                s.term = semester.term,
-                s.order = semester.order
-        """, semesters=semesters)
-        
-        print(f"Created {len(semesters)} semester nodes")
-        
-        # Create OFFERED_IN relationships
-        # Strategy: Most courses offered every semester, some only Fall or Spring
-        print("Creating OFFERED_IN relationships...")
-        
-        # Get all courses
-        result = session.run("MATCH (c:Course) RETURN c.code as code")
-        courses = [record["code"] for record in result]
-        
-        offerings_created = 0
-        
+    # One-off statements go through execute_query, which manages its own
+    # session and routes to the writer (or a reader for the course list)
+    db = os.getenv("NEO4J_DATABASE", "neo4j")
+
+    # Create constraint on semester ID
+    try:
+        driver.execute_query("""
+            CREATE CONSTRAINT semester_id_unique IF NOT EXISTS
+            FOR (s:Semester) REQUIRE s.id IS UNIQUE
+        """, database_=db, routing_=RoutingControl.WRITE)
+    except Exception as e:
+        print(f"Constraint may already exist: {e}")
+    
+    # Create semester nodes
+    driver.execute_query("""
+        UNWIND $semesters AS semester
+        MERGE (s:Semester {id: semester.id})
+        SET s.name = semester.name,
+            s.year = semester.year,
+            s.term = semester.term,
+            s.order = semester.order
+    """, semesters=semesters, database_=db, routing_=RoutingControl.WRITE)
+    
+    print(f"Created {len(semesters)} semester nodes")
+    
+    # Create OFFERED_IN relationships
+    # Strategy: Most courses offered every semester, some only Fall or Spring
+    print("Creating OFFERED_IN relationships...")
+    
+    # Get all courses
+    records, _, _ = driver.execute_query(
+        "MATCH (c:Course) RETURN c.code as code",
+        database_=db,
+        routing_=RoutingControl.READ,
+    )
+    courses = [record["code"] for record in records]
+    
+    all_semester_ids = [s["id"] for s in semesters]
+    fall_semester_ids = [s["id"] for s in semesters if s["term"] == "Fall"]
+
+    def offering_pairs():
         for course_code in courses:
             # Simple heuristic: 
             # - Intro courses (100-level): offered every semester
@@ -197,80 +261,72 @@ def create_semesters_and_offerings(driver):
             # - Advanced (400+): maybe only Fall or only Spring
             
             # Extract course level from code (e.g., "CS 101" -> 101)
-            try:
-                parts = course_code.split()
-                if len(parts) >= 2:
-                    course_num = int(''.join(filter(str.isdigit, parts[1])))
-                else:
-                    course_num = 0
-            except:
-                course_num = 0
+            match = LEVEL_RE.search(course_code)
+            course_num = int(match.group(1)) if match else 0
             
             # Determine which semesters to offer the course
             if course_num < 400:
                 # Offer every semester
-                offered_semesters = [s["id"] for s in semesters]
+                offered_semesters = all_semester_ids
             else:
                 # Advanced courses: alternate or limit offerings
                 # For simplicity, offer only in Fall semesters
-                offered_semesters = [s["id"] for s in semesters if s["term"] == "Fall"]
-            
-            # Create relationships
-            for semester_id in offered_semesters:
-                session.run("""
-                    MATCH (c:Course {code: $course_code})
-                    MATCH (s:Semester {id: $semester_id})
-                    MERGE (c)-[:OFFERED_IN]->(s)
-                """, course_code=course_code, semester_id=semester_id)
-                offerings_created += 1
-        
-        print(f"Created {offerings_created} OFFERED_IN relationships")
-        
-        # Create some sample students with completed courses
-        print("Creating sample students...")
-        sample_students = [
-            {
-                "id": "S001",
-                "name": "Alice Johnson",
-                "email": "alice@example.com",
-                "program": "Computer Science",
-                "completed": ["CS 101", "MATH 220", "PHYS 211"]
-            },
-            {
-                "id": "S002", 
-                "name": "Bob Smith",
-                "email": "bob@example.com",
-                "program": "Computer Science",
-                "completed": ["CS 101", "CS 173", "MATH 220", "MATH 231"]
-            },
-            {
-                "id": "S003",
-                "name": "Carol Williams",
-                "email": "carol@example.com", 
-                "program": "Computer Science",
-                "completed": []  # Freshman, no courses yet
-            }
-        ]
-        
-        for student in sample_students:
-            # Create student node
-            session.run("""
-                MERGE (s:Student {id: $id})
-                SET s.name = $name,
-                    s.email = $email,
-                    s.program = $program
-            """, id=student["id"], name=student["name"], 
-                 email=student["email"], program=student["program"])
-            
-            # Create HAS_COMPLETED relationships
-            for course_code in student["completed"]:
-                session.run("""
-                    MATCH (s:Student {id: $student_id})
-                    MATCH (c:Course {code: $course_code})
-                    MERGE (s)-[:HAS_COMPLETED]->(c)
-                """, student_id=student["id"], course_code=course_code)
-        
-        print(f"Created {len(sample_students)} sample students")
+                offered_semesters = fall_semester_ids
+
+            for sid in offered_semesters:
+                yield {"co": course_code, "se": sid}
+
+    # Create all relationships with batched UNWIND writes; pairs are
+    # generated lazily, one batch at a time
+    with seed_session(driver) as session:
+        offerings_created = run_write_batches(
+            session,
+            MERGE_OFFERINGS,
+            offering_pairs(),
+        )
+    
+    print(f"Created {offerings_created} OFFERED_IN relationships")
+    
+    # Create some sample students with completed courses
+    print("Creating sample students...")
+    sample_students = [
+        {
+            "id": "S001",
+            "name": "Alice Johnson",
+            "email": "alice@example.com",
+            "program": "Computer Science",
+            "completed": ["CS 101", "MATH 220", "PHYS 211"]
+        },
+        {
+            "id": "S002", 
+            "name": "Bob Smith",
+            "email": "bob@example.com",
+            "program": "Computer Science",
+            "completed": ["CS 101", "CS 173", "MATH 220", "MATH 231"]
+        },
+        {
+            "id": "S003",
+            "name": "Carol Williams",
+            "email": "carol@example.com", 
+            "program": "Computer Science",
+            "completed": []  # Freshman, no courses yet
+        }
+    ]
+    
+    # Create student nodes and their HAS_COMPLETED relationships
+    driver.execute_query("""
+        UNWIND $students AS student
+        MERGE (s:Student {id: student.id})
+        SET s.name = student.name,
+            s.email = student.email,
+            s.program = student.program
+        WITH s, student
+        UNWIND student.completed AS course_code
+        MATCH (c:Course {code: course_code})
+        MERGE (s)-[:HAS_COMPLETED]->(c)
+    """, students=sample_students, database_=db, routing_=RoutingControl.WRITE)
+
+    print(f"Created {len(sample_students)} sample students")
 
 
 # --------------------------------------------------------------
@@ -284,15 +340,19 @@ def main():
 
     base = Path("data")
 
-    import_degrees(driver, base / "degrees.csv")
-    import_degree_requirements(driver, base / "degree_requirements.csv")
-    import_students(driver, base / "students.csv")
+    with seed_session(driver) as session:
+        create_constraints(session)
+        import_degrees(session, base / "degrees.csv")
+        # Kept sequential: requirements and students both lock the Degree
+        # nodes they attach to, so running them concurrently deadlocks
+        import_degree_requirements(session, base / "degree_requirements.csv")
+        import_students(session, base / "students.csv")
 
-    enrollments_csv = base / "student_enrollments.csv"
-    if enrollments_csv.exists():
-        import_student_enrollments(driver, enrollments_csv)
-    else:
-        print("⚠ No student_enrollments.csv file found. Skipping enrollment import.\n")
+        enrollments_csv = base / "student_enrollments.csv"
+        if enrollments_csv.exists():
+            import_student_enrollments(session, enrollments_csv)
+        else:
+            print("⚠ No student_enrollments.csv file found. Skipping enrollment import.\n")
 
     create_semesters_and_offerings(driver)
     print("\nDatabase seeding complete with semesters.")
@@ -1,7 +1,53 @@
 import sys
 from pathlib import Path
 
+import pytest
+
 # Add project root to PYTHONPATH
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 sys.path.append(str(PROJECT_ROOT))
 
+
+@pytest.fixture(scope="session")
+def client():
+    """
+    One TestClient for the whole session; the `with` block runs the app's
+    lifespan once, so the Neo4j driver and pool are set up a single time.
+    Server errors come back as 500 responses rather than being re-raised,
+    so tests only need to check status codes.
+    """
+    # imported here so the unit tests never load the app
+    # pylint: disable=import-outside-toplevel
+    from fastapi.testclient import TestClient
+    from main import app
+
+    with TestClient(app, raise_server_exceptions=False) as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope="session")
+def neo4j_available(client):
+    """
+    Whether the app can reach Neo4j, probed once through /health. Tests that
+    need live data skip themselves when it is False.
+    """
+    response = client.get("/health")
+    return response.status_code == 200 and response.json().get("neo4j_ok", False)
+
+
+@pytest.fixture(scope="session")
+def cached_get(client):
+    """
+    GET through the shared client, memoized per (path, params) for the
+    session. Use it for read-only shape checks that repeat the same request;
+    tests that need a fresh response should call client.get directly.
+    """
+    responses = {}
+
+    def get(path, params=None):
+        key = (path, tuple(sorted((params or {}).items())))
+        if key not in responses:
+            responses[key] = client.get(path, params=params)
+        return responses[key]
+
+    return get
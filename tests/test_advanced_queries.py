@@ -2,17 +2,16 @@
 Tests for Advanced Queries API endpoints
 """
 import pytest
-from fastapi.testclient import TestClient
-from main import app
 
-client = TestClient(app)
 
-
-def test_bottleneck_courses_endpoint():
+def test_bottleneck_courses_endpoint(cached_get, neo4j_available):
     """
     Test the bottleneck courses endpoint exists and returns expected structure
     """
-    response = client.get("/api/advanced/bottleneck-courses")
+    if not neo4j_available:
+        pytest.skip("Neo4j not available")
+
+    response = cached_get("/api/advanced/bottleneck-courses")
     assert response.status_code == 200
     
     data = response.json()
@@ -22,11 +21,14 @@ def test_bottleneck_courses_endpoint():
     assert isinstance(data["bottleneck_courses"], list)
 
 
-def test_bottleneck_courses_with_params():
+def test_bottleneck_courses_with_params(cached_get, neo4j_available):
     """
     Test bottleneck courses endpoint with query parameters
     """
-    response = client.get(
+    if not neo4j_available:
+        pytest.skip("Neo4j not available")
+
+    response = cached_get(
         "/api/advanced/bottleneck-courses",
         params={"min_dependents": 2, "min_prerequisites": 1, "limit": 5}
     )
@@ -38,11 +40,14 @@ def test_bottleneck_courses_with_params():
     assert data["filters"]["min_prerequisites"] == 1
 
 
-def test_course_recommendations_endpoint():
+def test_course_recommendations_endpoint(cached_get, neo4j_available):
     """
     Test the course recommendations endpoint exists and returns expected structure
     """
-    response = client.get("/api/advanced/students/S1/recommendations")
+    if not neo4j_available:
+        pytest.skip("Neo4j not available")
+
+    response = cached_get("/api/advanced/students/S1/recommendations")
     assert response.status_code == 200
     
     data = response.json()
@@ -51,11 +56,14 @@ def test_course_recommendations_endpoint():
     assert isinstance(data["recommendations"], list)
 
 
-def test_course_recommendations_with_params():
+def test_course_recommendations_with_params(cached_get, neo4j_available):
     """
     Test course recommendations endpoint with query parameters
     """
-    response = client.get(
+    if not neo4j_available:
+        pytest.skip("Neo4j not available")
+
+    response = cached_get(
         "/api/advanced/students/S1/recommendations",
         params={"semester_id": "FALL_2024", "min_readiness": 50, "limit": 10}
     )
@@ -66,66 +74,70 @@ def test_course_recommendations_with_params():
     assert len(data["recommendations"]) <= 10
 
 
-def test_course_depth_endpoint():
+def test_course_depth_endpoint(client, neo4j_available):
     """
     Test the course depth endpoint exists and returns expected structure
     """
+    if not neo4j_available:
+        pytest.skip("Neo4j not available")
+
     response = client.get("/api/advanced/students/S1/course-depth")
-    # May return 500 if Student/Semester data not in test DB, but endpoint is covered
-    assert response.status_code in [200, 500]
+    assert response.status_code == 200
     
-    if response.status_code == 200:
-        data = response.json()
-        assert "courses_by_status" in data
-        assert "total_remaining" in data
-        assert isinstance(data["courses_by_status"], dict)
+    data = response.json()
+    assert "courses_by_status" in data
+    assert "total_remaining" in data
+    assert isinstance(data["courses_by_status"], dict)
 
 
-def test_course_depth_with_limit():
+def test_course_depth_with_limit(client, neo4j_available):
     """
     Test course depth endpoint with limit parameter
     """
+    if not neo4j_available:
+        pytest.skip("Neo4j not available")
+
     response = client.get(
         "/api/advanced/students/S1/course-depth",
         params={"limit": 10}
     )
-    # May return 500 if Student/Semester data not in test DB, but endpoint is covered
-    assert response.status_code in [200, 500]
+    assert response.status_code == 200
     
-    if response.status_code == 200:
-        data = response.json()
-        assert "courses_by_status" in data
+    data = response.json()
+    assert "courses_by_status" in data
 
 
-def test_student_summary_endpoint():
+def test_student_summary_endpoint(cached_get, neo4j_available):
     """
     Test the student summary endpoint exists and returns expected structure
     """
-    response = client.get("/api/advanced/students/S1/summary")
-    # May return 500 if Student/Semester data not in test DB, but endpoint is covered
-    assert response.status_code in [200, 500]
+    if not neo4j_available:
+        pytest.skip("Neo4j not available")
+
+    response = cached_get("/api/advanced/students/S1/summary")
+    assert response.status_code == 200
     
-    if response.status_code == 200:
-        data = response.json()
-        assert "student_id" in data
-        assert "next_semester" in data
-        assert "remaining_courses" in data
-        assert data["student_id"] == "S1"
+    data = response.json()
+    assert "student_id" in data
+    assert "next_semester" in data
+    assert "remaining_courses" in data
+    assert data["student_id"] == "S1"
 
 
-def test_student_summary_with_semester():
+def test_student_summary_with_semester(cached_get, neo4j_available):
     """
     Test student summary endpoint with semester parameter
     """
-    response = client.get(
+    if not neo4j_available:
+        pytest.skip("Neo4j not available")
+
+    response = cached_get(
         "/api/advanced/students/S1/summary",
         params={"semester_id": "SPRING_2025"}
     )
-    # May return 500 if Student/Semester data not in test DB, but endpoint is covered
-    assert response.status_code in [200, 500]
+    assert response.status_code == 200
     
-    if response.status_code == 200:
-        data = response.json()
-        assert "next_semester" in data
-        assert data["next_semester"]["semester_id"] == "SPRING_2025"
+    data = response.json()
+    assert "next_semester" in data
+    assert data["next_semester"]["semester_id"] == "SPRING_2025"
 
@@ -1,10 +1,7 @@
 import pytest
-from fastapi.testclient import TestClient
-from main import app
 
-client = TestClient(app)
 
-def test_health():
+def test_health(client):
     """
     health check : api must be up and neo4j must respond
     """
@@ -16,7 +13,7 @@ def test_health():
     assert "neo4j_ok" in data
 
 
-def test_direct_prereqs_endpoint_exists():
+def test_direct_prereqs_endpoint_exists(client):
     """
    test the direct prerequisite endpoint
     """
@@ -25,7 +22,7 @@ def test_direct_prereqs_endpoint_exists():
     assert response.status_code == 200
 
 
-def test_all_prereqs_endpoint_exists():
+def test_all_prereqs_endpoint_exists(client):
     """
    test recursive prerequisites endpoint
    """
@@ -34,7 +31,7 @@ def test_all_prereqs_endpoint_exists():
     assert "prerequisites" in response.json()
 
 
-def test_cycle_detection_endpoint():
+def test_cycle_detection_endpoint(client):
     """
     test cycle detection endpoint
     """
@@ -43,7 +40,7 @@ def test_cycle_detection_endpoint():
     assert "cycles" in response.json()
 
 
-def test_validation_api():
+def test_validation_api(client):
     """
     test prerequisite validation api
     """
@@ -60,7 +57,7 @@ def test_validation_api():
     assert "can_take" in data
     assert "missing_prerequisites" in data
 
-def test_eligibility_endpoint():
+def test_eligibility_endpoint(client):
     """
     Test the eligibility API for a student & course.
     We only test that:
@@ -2,33 +2,32 @@
 Tests for Degree Planner API endpoints
 """
 import pytest
-from fastapi.testclient import TestClient
-from main import app
 
-client = TestClient(app)
 
-
-def test_degree_planner_endpoint():
+def test_degree_planner_endpoint(client, neo4j_available):
     """
     Test the degree planner endpoint exists and returns expected structure
     """
+    if not neo4j_available:
+        pytest.skip("Neo4j not available")
+
     response = client.get("/api/students/S1/plan/sequence?target=CS")
-    # May return 500 if Student/Degree data not in test DB, but endpoint is covered
-    assert response.status_code in [200, 500]
+    assert response.status_code == 200
     
-    if response.status_code == 200:
-        data = response.json()
-        assert "student_id" in data
-        assert "degree_id" in data
-        assert "remaining_courses" in data
-        assert "recommended_sequence" in data
+    data = response.json()
+    assert "student_id" in data
+    assert "degree_id" in data
+    assert "remaining_courses" in data
+    assert "recommended_sequence" in data
 
 
-def test_degree_planner_with_different_student():
+def test_degree_planner_with_different_student(client, neo4j_available):
     """
     Test degree planner with different student ID
     """
+    if not neo4j_available:
+        pytest.skip("Neo4j not available")
+
     response = client.get("/api/students/S2/plan/sequence?target=MATH")
-    # May return 500 if Student/Degree data not in test DB, but endpoint is covered
-    assert response.status_code in [200, 500]
+    assert response.status_code == 200
 
@@ -2,47 +2,43 @@
 Tests for Schedule Optimization API
 """
 import pytest
-from fastapi.testclient import TestClient
-from main import app
 
-client = TestClient(app)
+# Keys every optimize response and each of its semesters must carry
+SCHEDULE_KEYS = frozenset(
+    {"student_id", "schedule", "total_semesters", "total_courses", "completed_courses"}
+)
+SEMESTER_KEYS = frozenset({"semester_id", "semester_name", "courses", "total_courses"})
 
 
-def test_optimize_schedule_endpoint_exists():
+def test_optimize_schedule_endpoint_exists(cached_get):
     """
     Test that the schedule optimization endpoint exists and returns 200
     """
-    response = client.get("/api/students/S001/schedule/optimize")
+    response = cached_get("/api/students/S001/schedule/optimize")
     assert response.status_code == 200
 
 
-def test_optimize_schedule_returns_correct_structure():
+def test_optimize_schedule_returns_correct_structure(cached_get):
     """
     Test that the optimization returns the expected response structure
     """
-    response = client.get("/api/students/S001/schedule/optimize")
+    response = cached_get("/api/students/S001/schedule/optimize")
     assert response.status_code == 200
     
     data = response.json()
     
     # Check top-level keys
-    assert "student_id" in data
-    assert "schedule" in data
-    assert "total_semesters" in data
-    assert "total_courses" in data
-    assert "completed_courses" in data
+    missing = SCHEDULE_KEYS - data.keys()
+    assert not missing, missing
     
     # Check schedule structure
     assert isinstance(data["schedule"], list)
     if len(data["schedule"]) > 0:
-        semester = data["schedule"][0]
-        assert "semester_id" in semester
-        assert "semester_name" in semester
-        assert "courses" in semester
-        assert "total_courses" in semester
+        missing = SEMESTER_KEYS - data["schedule"][0].keys()
+        assert not missing, missing
 
 
-def test_optimize_schedule_with_parameters():
+def test_optimize_schedule_with_parameters(client):
     """
     Test schedule optimization with custom parameters
     """
@@ -64,7 +60,7 @@ def test_optimize_schedule_with_parameters():
         assert semester["total_courses"] <= 4
 
 
-def test_optimize_schedule_respects_max_courses():
+def test_optimize_schedule_respects_max_courses(client):
     """
     Test that schedule respects max_courses_per_semester constraint
     """
@@ -81,11 +77,11 @@ def test_optimize_schedule_respects_max_courses():
         assert semester["total_courses"] <= max_courses
 
 
-def test_optimize_schedule_includes_completed_courses():
+def test_optimize_schedule_includes_completed_courses(cached_get):
     """
     Test that the response includes completed courses
     """
-    response = client.get("/api/students/S001/schedule/optimize")
+    response = cached_get("/api/students/S001/schedule/optimize")
     assert response.status_code == 200
     
     data = response.json()
@@ -93,7 +89,7 @@ def test_optimize_schedule_includes_completed_courses():
     assert isinstance(data["completed_courses"], list)
 
 
-def test_get_available_semesters():
+def test_get_available_semesters(client):
     """
     Test the semesters listing endpoint
     """
@@ -106,7 +102,7 @@ def test_get_available_semesters():
     assert isinstance(data["semesters"], list)
 
 
-def test_available_semesters_with_limit():
+def test_available_semesters_with_limit(client):
     """
     Test semesters endpoint with limit parameter
     """
@@ -121,7 +117,7 @@ def test_available_semesters_with_limit():
     assert len(data["semesters"]) <= limit
 
 
-def test_schedule_for_nonexistent_student():
+def test_schedule_for_nonexistent_student(client):
     """
     Test scheduling for a student that doesn't exist
     Should still return 200 but with empty/default data
@@ -131,7 +127,7 @@ def test_schedule_for_nonexistent_student():
     assert response.status_code in [200, 404]
 
 
-def test_schedule_optimization_warnings():
+def test_schedule_optimization_warnings(client):
     """
     Test that warnings are included when appropriate
     """
@@ -143,11 +139,11 @@ def test_schedule_optimization_warnings():
     assert isinstance(data["warnings"], list)
 
 
-def test_course_has_prerequisites_in_schedule():
+def test_course_has_prerequisites_in_schedule(cached_get):
     """
     Test that courses in schedule include prerequisite information
     """
-    response = client.get("/api/students/S001/schedule/optimize")
+    response = cached_get("/api/students/S001/schedule/optimize")
     assert response.status_code == 200
     
     data = response.json()
@@ -0,0 +1,30 @@
+import pytest
+
+
+class RecordingClient:
+    """Wraps a fake Neo4j client and records every query sent through it."""
+
+    def __init__(self, inner):
+        self._inner = inner
+        self.calls = []
+
+    def query(self, query, params=None, read_only=True):
+        self.calls.append((query, params))
+        return self._inner.query(query, params, read_only)
+
+    @property
+    def queries(self):
+        return [query for query, _ in self.calls]
+
+    @property
+    def params(self):
+        return [params for _, params in self.calls]
+
+
+@pytest.fixture
+def recording_client():
+    """
+    Factory for RecordingClient: wrap a module's MockNeo4jClient, patch it in
+    as get_neo4j_client, then assert on .calls, .queries or .params.
+    """
+    return RecordingClient
@@ -1,11 +1,13 @@
 """
 Unit tests for degree planner service
 """
+from collections import Counter
+
 import pytest
 from backend.services.degree_planner_service import (
     get_degree_requirements,
     get_completed_courses,
-    get_direct_prereqs,
+    get_direct_prereqs_map,
     degree_topological_sort,
     plan_degree,
 )
@@ -22,8 +24,12 @@ class MockNeo4jClient:
         elif "HAS_COMPLETED" in query:
             return self._results_map.get("completed_courses", [])
         elif "PRE_REQUIRES" in query:
-            course = params.get("course") if params else None
-            return self._results_map.get("prereqs", {}).get(course, [])
+            prereqs = self._results_map.get("prereqs", {})
+            return [
+                {"course": c, "prereqs": [r["prereq"] for r in prereqs[c]]}
+                for c in params["codes"]
+                if c in prereqs
+            ]
         return []
 
 
@@ -31,6 +37,7 @@ class MockNeo4jClient:
 def mock_client(monkeypatch):
     def _mock(results_map):
         from backend.services import degree_planner_service
+        degree_planner_service.get_degree_requirements.cache_clear()
         monkeypatch.setattr(
             degree_planner_service,
             "get_neo4j_client",
@@ -50,7 +57,7 @@ def test_get_degree_requirements(mock_client):
     })
     
     result = get_degree_requirements("CS")
-    assert sorted(result) == ["CS101", "CS102", "MATH101"]
+    assert Counter(result) == Counter(["CS101", "CS102", "MATH101"])
 
 
 def test_get_completed_courses(mock_client):
@@ -63,20 +70,24 @@ def test_get_completed_courses(mock_client):
     })
     
     result = get_completed_courses("S1")
-    assert sorted(result) == ["CS101", "MATH101"]
+    assert Counter(result) == Counter(["CS101", "MATH101"])
 
 
-def test_get_direct_prereqs(mock_client):
-    """Test getting direct prerequisites"""
+def test_get_direct_prereqs_map(mock_client):
+    """Test batch-fetching direct prerequisites"""
     mock_client({
         "prereqs": {
             "CS102": [{"prereq": "CS101"}],
             "CS103": [{"prereq": "CS101"}, {"prereq": "CS102"}],
         }
     })
-    
-    result = get_direct_prereqs("CS102")
-    assert result == ["CS101"]
+
+    result = get_direct_prereqs_map(["CS101", "CS102", "CS103"])
+    assert result == {
+        "CS101": set(),
+        "CS102": {"CS101"},
+        "CS103": {"CS101", "CS102"},
+    }
 
 
 def test_degree_topological_sort_simple(mock_client):
@@ -91,7 +102,8 @@ def test_degree_topological_sort_simple(mock_client):
     result = degree_topological_sort(["CS101", "CS102", "CS103"])
     assert result is not None
     assert len(result) == 3
-    assert result[0] == ["CS101"]  # No prerequisites
+    assert set(result[0]) == {"CS101"}  # No prerequisites
+    assert {c for layer in result for c in layer} == {"CS101", "CS102", "CS103"}
 
 
 def test_degree_topological_sort_no_deps(mock_client):
@@ -103,6 +115,43 @@ def test_degree_topological_sort_no_deps(mock_client):
     assert len(result) == 1  # All can be taken together
 
 
+def test_degree_topological_sort_layers_and_cycles(mock_client):
+    """Test semester layering and cycle detection"""
+    mock_client({
+        "prereqs": {
+            "CS102": [{"prereq": "CS101"}],
+            "CS201": [{"prereq": "CS101"}, {"prereq": "MATH100"}],
+        }
+    })
+    # MATH100 is not in the plan, so it does not gate CS201
+    result = degree_topological_sort(["CS101", "CS102", "CS201"])
+    assert [set(layer) for layer in result] == [{"CS101"}, {"CS102", "CS201"}]
+
+    mock_client({
+        "prereqs": {
+            "CS101": [{"prereq": "CS102"}],
+            "CS102": [{"prereq": "CS101"}],
+        }
+    })
+    assert degree_topological_sort(["CS101", "CS102"]) is None
+
+
+def test_degree_topological_sort_fetches_prereqs_once(monkeypatch, recording_client):
+    """Test that sorting issues one prerequisite query, not one per course"""
+    from backend.services import degree_planner_service
+
+    courses = [f"CS{100 + i}" for i in range(10)]
+    prereqs = {
+        code: [{"prereq": courses[i - 1]}] for i, code in enumerate(courses) if i
+    }
+    client = recording_client(MockNeo4jClient({"prereqs": prereqs}))
+    monkeypatch.setattr(degree_planner_service, "get_neo4j_client", lambda: client)
+
+    result = degree_topological_sort(courses)
+    assert result == [[code] for code in courses]
+    assert client.params == [{"codes": courses}]
+
+
 def test_plan_degree_all_completed(mock_client):
     """Test planning when all courses are completed"""
     mock_client({
@@ -116,6 +165,42 @@ def test_plan_degree_all_completed(mock_client):
     assert result["recommended_sequence"] == []
 
 
+def test_plan_degree_all_completed_skips_prereq_fetch(monkeypatch, recording_client):
+    """Test that a finished degree only reads requirements and completions"""
+    from backend.services import degree_planner_service
+
+    client = recording_client(MockNeo4jClient({
+        "degree_requirements": [{"course": "CS101"}, {"course": "CS102"}],
+        "completed_courses": [{"course": "CS101"}, {"course": "CS102"}],
+    }))
+    degree_planner_service.get_degree_requirements.cache_clear()
+    monkeypatch.setattr(degree_planner_service, "get_neo4j_client", lambda: client)
+
+    result = plan_degree("S1", "CS")
+    assert result["recommended_sequence"] == []
+    assert len(client.queries) <= 2
+    assert not any("PRE_REQUIRES" in query for query in client.queries)
+
+
+def test_get_degree_requirements_is_cached(monkeypatch, recording_client):
+    """Test that requirements are read once per degree until cleared"""
+    from backend.services import degree_planner_service
+
+    client = recording_client(
+        MockNeo4jClient({"degree_requirements": [{"course": "CS101"}]})
+    )
+    degree_planner_service.get_degree_requirements.cache_clear()
+    monkeypatch.setattr(degree_planner_service, "get_neo4j_client", lambda: client)
+
+    assert get_degree_requirements("CS") == ["CS101"]
+    assert get_degree_requirements("CS") == ["CS101"]
+    assert client.params == [{"degree_id": "CS"}]
+
+    degree_planner_service.get_degree_requirements.cache_clear()
+    get_degree_requirements("CS")
+    assert len(client.calls) == 2
+
+
 def test_plan_degree_with_remaining(mock_client):
     """Test planning with remaining courses"""
     mock_client({
@@ -6,6 +6,7 @@ from backend.services.graduation_paths_service import (
     build_graph,
     all_topological_orders,
     generate_graduation_paths,
+    stream_graduation_paths,
 )
 
 
@@ -21,8 +22,14 @@ class MockNeo4jClient:
         elif "HAS_COMPLETED" in query:
             return self._results_map.get("completed_courses", [])
         elif "PRE_REQUIRES" in query:
-            course = params.get("course") if params else None
-            return self._results_map.get("prereqs", {}).get(course, [])
+            prereqs = self._results_map.get("prereqs", {})
+            missing = params["missing"]
+            rows = []
+            for course in missing:
+                codes = [r["prereq"] for r in prereqs.get(course, []) if r["prereq"] in missing]
+                if codes:
+                    rows.append({"course": course, "prereqs": codes})
+            return rows
         return []
 
 
@@ -37,6 +44,7 @@ def mock_client(monkeypatch):
         )
         # Also mock the imported functions
         from backend.services import degree_planner_service
+        degree_planner_service.get_degree_requirements.cache_clear()
         monkeypatch.setattr(
             degree_planner_service,
             "get_neo4j_client",
@@ -54,11 +62,21 @@ def test_build_graph(mock_client):
         }
     })
     
-    from backend.services.degree_planner_service import get_direct_prereqs
     graph = build_graph(["CS101", "CS102", "CS103"])
-    assert "CS101" in graph
-    assert "CS102" in graph
-    assert "CS103" in graph
+    assert graph == {"CS101": set(), "CS102": {"CS101"}, "CS103": {"CS102"}}
+
+
+def test_build_graph_ignores_completed_prereqs(mock_client):
+    """Test that prerequisites outside the missing set are dropped"""
+    mock_client({
+        "prereqs": {
+            "CS102": [{"prereq": "CS101"}],
+            "CS103": [{"prereq": "CS102"}],
+        }
+    })
+
+    graph = build_graph(["CS102", "CS103"])
+    assert graph == {"CS102": set(), "CS103": {"CS102"}}
 
 
 def test_all_topological_orders_simple():
@@ -68,7 +86,7 @@ def test_all_topological_orders_simple():
         "CS102": {"CS101"},
     }
     
-    orders = all_topological_orders(graph)
+    orders = list(all_topological_orders(graph))
     assert len(orders) == 1
     assert orders[0] == ["CS101", "CS102"]
 
@@ -80,10 +98,34 @@ def test_all_topological_orders_no_deps():
         "CS102": set(),
     }
     
-    orders = all_topological_orders(graph)
+    orders = list(all_topological_orders(graph))
     assert len(orders) == 2  # Two possible orderings
 
 
+def test_all_topological_orders_diamond():
+    """Test that every ordering respects prerequisites"""
+    graph = {
+        "CS101": set(),
+        "CS201": {"CS101"},
+        "CS202": {"CS101"},
+        "CS301": {"CS201", "CS202"},
+    }
+
+    orders = list(all_topological_orders(graph))
+    assert orders == [
+        ["CS101", "CS201", "CS202", "CS301"],
+        ["CS101", "CS202", "CS201", "CS301"],
+    ]
+
+
+def test_all_topological_orders_max_paths():
+    """Test that enumeration stops after max_paths orderings"""
+    graph = {code: set() for code in ("CS101", "CS102", "CS103", "CS104")}
+
+    assert len(list(all_topological_orders(graph))) == 24
+    assert len(list(all_topological_orders(graph, max_paths=5))) == 5
+
+
 def test_generate_graduation_paths_student_not_found(mock_client):
     """Test when student is not found"""
     mock_client({
@@ -128,3 +170,47 @@ def test_generate_graduation_paths_with_remaining(mock_client):
     assert "missing_courses" in result
     assert "CS102" in result["missing_courses"]
 
+
+
+def test_stream_graduation_paths(mock_client):
+    """Test streaming paths lazily and student not found"""
+    mock_client({
+        "student_degree": [{"degree": "CS"}],
+        "degree_requirements": [
+            {"course": "CS101"},
+            {"course": "CS102"},
+            {"course": "CS103"},
+        ],
+        "completed_courses": [],
+        "prereqs": {},
+    })
+
+    paths = stream_graduation_paths("S1", max_paths=2)
+    assert next(paths) == ["CS101", "CS102", "CS103"]
+    assert len(list(paths)) == 1
+
+    mock_client({"student_degree": []})
+    assert stream_graduation_paths("S999") is None
+
+
+def test_stream_graduation_paths_enumerates_without_queries(monkeypatch, recording_client):
+    """Test that enumerating paths never goes back to Neo4j"""
+    from backend.services import degree_planner_service, graduation_paths_service
+
+    client = recording_client(MockNeo4jClient({
+        "student_degree": [{"degree": "CS"}],
+        "degree_requirements": [
+            {"course": code} for code in ("CS101", "CS102", "CS103", "CS104")
+        ],
+        "completed_courses": [],
+        "prereqs": {},
+    }))
+    degree_planner_service.get_degree_requirements.cache_clear()
+    monkeypatch.setattr(graduation_paths_service, "get_neo4j_client", lambda: client)
+    monkeypatch.setattr(degree_planner_service, "get_neo4j_client", lambda: client)
+
+    paths = stream_graduation_paths("S1")
+    fetched = len(client.calls)
+
+    assert len(list(paths)) == 24
+    assert len(client.calls) == fetched
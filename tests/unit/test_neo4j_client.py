@@ -0,0 +1,204 @@
+"""
+Unit tests for the Neo4jClient wrapper
+"""
+import threading
+import time
+
+import pytest
+from neo4j.exceptions import ServiceUnavailable
+
+from backend.database.neo4j import Neo4jClient, Neo4jUnavailableError, singleton, timed_work
+
+
+class FakeResult:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def data(self):
+        return [dict(row) for row in self._rows]
+
+    def __iter__(self):
+        return (FakeRecord(row) for row in self._rows)
+
+
+class FakeRecord:
+    def __init__(self, row):
+        self._row = row
+
+    def data(self):
+        return dict(self._row)
+
+
+class FakeTx:
+    def __init__(self, driver):
+        self._driver = driver
+
+    def run(self, query, parameters=None, **kwparameters):
+        self._driver.calls.append((query, parameters or kwparameters))
+        return FakeResult(self._driver.rows)
+
+
+class FakeSession:
+    def __init__(self, driver):
+        self._driver = driver
+        self._closed = False
+
+    def closed(self):
+        return self._closed
+
+    def close(self):
+        self._closed = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def run(self, query, parameters=None, **kwparameters):
+        return FakeTx(self._driver).run(query, parameters, **kwparameters)
+
+    def execute_read(self, work):
+        return work(FakeTx(self._driver))
+
+    def execute_write(self, work):
+        return work(FakeTx(self._driver))
+
+
+class FakeDriver:
+    def __init__(self, rows):
+        self.rows = rows
+        self.calls = []
+        self.sessions = 0
+
+    def session(self, **kwargs):
+        self.sessions += 1
+        return FakeSession(self)
+
+
+@pytest.fixture
+def driver():
+    return FakeDriver([{"code": "CS101"}])
+
+
+def test_read_query_is_cached(driver):
+    """Identical read-only queries hit Neo4j once"""
+    client = Neo4jClient(driver)
+
+    first = client.query("MATCH (c) RETURN c.code AS code", {"code": "CS101"})
+    second = client.query("MATCH (c) RETURN c.code AS code", {"code": "CS101"})
+
+    assert first == second == [{"code": "CS101"}]
+    assert len(driver.calls) == 1
+
+
+def test_cached_rows_are_not_shared(driver):
+    """Mutating a returned row does not poison the cache"""
+    client = Neo4jClient(driver)
+
+    client.query("MATCH (c) RETURN c.code AS code")[0]["code"] = "changed"
+
+    assert client.query("MATCH (c) RETURN c.code AS code") == [{"code": "CS101"}]
+
+
+def test_list_parameters_are_cacheable(driver):
+    """List-valued parameters still produce a cache key"""
+    client = Neo4jClient(driver)
+
+    client.query("UNWIND $codes AS c RETURN c AS code", {"codes": ["CS101", "CS102"]})
+    client.query("UNWIND $codes AS c RETURN c AS code", {"codes": ["CS101", "CS102"]})
+
+    assert len(driver.calls) == 1
+
+
+def test_write_query_invalidates_cache(driver):
+    """Write queries bypass and clear the read cache"""
+    client = Neo4jClient(driver)
+
+    client.query("MATCH (c) RETURN c.code AS code")
+    client.query("CREATE (c:Course {code: 'X'})", read_only=False)
+    client.query("MATCH (c) RETURN c.code AS code")
+
+    assert len(driver.calls) == 3
+
+
+def test_parameters_are_passed_as_a_dict(driver):
+    """Parameter names that clash with run() arguments are passed through"""
+    client = Neo4jClient(driver)
+
+    client.query("MATCH (c {code: $query}) RETURN c.code AS code", {"query": "CS101"})
+
+    assert driver.calls[0][1] == {"query": "CS101"}
+
+
+def test_stream_query_yields_records_lazily(driver):
+    """stream_query only runs the query once iteration starts"""
+    client = Neo4jClient(driver)
+
+    rows = client.stream_query("MATCH (c) RETURN c.code AS code")
+    assert driver.calls == []
+
+    assert list(rows) == [{"code": "CS101"}]
+    assert len(driver.calls) == 1
+
+
+def test_session_is_reused_within_a_thread(driver):
+    """query() keeps one session per thread until it is closed"""
+    client = Neo4jClient(driver)
+
+    client.query("MATCH (c) RETURN c.code AS code", {"code": "CS101"})
+    client.query("MATCH (c) RETURN c.code AS code", {"code": "CS102"})
+    assert driver.sessions == 1
+
+    client.close_sessions()
+    client.query("MATCH (c) RETURN c.code AS code", {"code": "CS103"})
+    assert driver.sessions == 2
+
+
+def test_transient_errors_are_reported_as_unavailable(driver):
+    """Transient driver failures surface as Neo4jUnavailableError"""
+    class UnreachableSession(FakeSession):
+        def execute_read(self, work):
+            raise ServiceUnavailable("connection refused")
+
+    driver.session = lambda **kwargs: UnreachableSession(driver)
+    client = Neo4jClient(driver)
+
+    with pytest.raises(Neo4jUnavailableError):
+        client.query("MATCH (c) RETURN c.code AS code")
+
+
+def test_singleton_builds_once_under_concurrent_first_calls():
+    """Concurrent first calls share one instance"""
+    built = []
+
+    @singleton
+    def factory():
+        time.sleep(0.01)
+        built.append(object())
+        return built[-1]
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(factory())) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(built) == 1
+    assert all(result is built[0] for result in results)
+
+
+def test_timed_work_reads_the_timeout_on_each_call(monkeypatch):
+    """A changed NEO4J_QUERY_TIMEOUT applies without rebuilding anything"""
+    def work(tx):
+        return tx
+
+    monkeypatch.setenv("NEO4J_QUERY_TIMEOUT", "5")
+    first = timed_work("q", work)
+    monkeypatch.setenv("NEO4J_QUERY_TIMEOUT", "2")
+    second = timed_work("q", work)
+
+    assert (first.timeout, second.timeout) == (5.0, 2.0)
+    assert second.metadata == {"query": "q"}
+    assert second("tx") == "tx"
@@ -1,3 +1,5 @@
+from collections import Counter
+
 import pytest
 from backend.services import prerequisites
 
@@ -28,7 +30,7 @@ def test_get_direct_prerequisites_basic(mock_client):
     ])
 
     result = prerequisites.get_direct_prerequisites("CS200")
-    assert sorted(result) == ["CS100", "MATH101"]
+    assert Counter(result) == Counter(["CS100", "MATH101"])
 
 
 def test_get_direct_prerequisites_empty(mock_client):
@@ -37,8 +39,17 @@ def test_get_direct_prerequisites_empty(mock_client):
     result = prerequisites.get_direct_prerequisites("INTRO101")
     assert result == []
 
-def test_check_student_can_take_course_not_found(mock_client):
-    # Neo4j returns no rows → course not found
+@pytest.fixture
+def prereq_table(monkeypatch):
+    monkeypatch.setattr(
+        prerequisites,
+        "get_prerequisite_table",
+        lambda: {"CS100": frozenset(), "CS200": frozenset({"CS100", "MATH101"})},
+    )
+
+
+def test_check_student_can_take_course_not_found(mock_client, prereq_table):
+    # Course is not in the prerequisite table
     mock_client([])
 
     result = prerequisites.check_student_can_take("S1", "CS999")
@@ -49,30 +60,20 @@ def test_check_student_can_take_course_not_found(mock_client):
     assert result["completed"] == []
 
 
-def test_check_student_can_take_student_not_found(mock_client):
+def test_check_student_can_take_student_not_found(mock_client, prereq_table):
     # Course exists, student does not
-    mock_client([{
-        "course": "CS200",
-        "required": ["CS100"],
-        "completed": [],
-        "student_exists": False,
-    }])
+    mock_client([{"completed": [], "student_exists": False}])
 
     result = prerequisites.check_student_can_take("S404", "CS200")
 
     assert result["can_take"] is False
     assert result["reason"] == "student_not_found"
-    assert result["missing"] == ["CS100"]
+    assert result["missing"] == ["CS100", "MATH101"]
 
 
-def test_check_student_can_take_ok(mock_client):
+def test_check_student_can_take_ok(mock_client, prereq_table):
     # Student completed all prerequisites
-    mock_client([{
-        "course": "CS200",
-        "required": ["CS100"],
-        "completed": ["CS100"],
-        "student_exists": True,
-    }])
+    mock_client([{"completed": ["CS100", "MATH101"], "student_exists": True}])
 
     result = prerequisites.check_student_can_take("S1", "CS200")
 
@@ -81,14 +82,9 @@ def test_check_student_can_take_ok(mock_client):
     assert result["reason"] == "ok"
 
 
-def test_check_student_can_take_missing_prereq(mock_client):
+def test_check_student_can_take_missing_prereq(mock_client, prereq_table):
     # Student missing prerequisites
-    mock_client([{
-        "course": "CS200",
-        "required": ["CS100", "MATH101"],
-        "completed": ["CS100"],
-        "student_exists": True,
-    }])
+    mock_client([{"completed": ["CS100"], "student_exists": True}])
 
     result = prerequisites.check_student_can_take("S1", "CS200")
 
@@ -96,3 +92,110 @@ def test_check_student_can_take_missing_prereq(mock_client):
     assert result["missing"] == ["MATH101"]
     assert result["reason"] == "missing_prerequisites"
 
+
+def test_check_student_can_take_batch(monkeypatch, prereq_table, recording_client):
+    client = recording_client(
+        MockNeo4jClient([{"completed": ["CS100"], "student_exists": True}])
+    )
+    monkeypatch.setattr(prerequisites, "get_neo4j_client", lambda: client)
+
+    results = prerequisites.check_student_can_take_batch("S1", ["CS200", "CS999", "CS100"])
+
+    assert [r["reason"] for r in results] == [
+        "missing_prerequisites",
+        "course_not_found",
+        "ok",
+    ]
+    assert results[0]["missing"] == ["MATH101"]
+    assert len(client.calls) == 1
+
+
+def test_check_student_can_take_binds_student_as_parameter(
+    monkeypatch, prereq_table, recording_client
+):
+    # Same Cypher text for every student, so the server's plan cache is reused
+    client = recording_client(
+        MockNeo4jClient([{"completed": [], "student_exists": True}])
+    )
+    monkeypatch.setattr(prerequisites, "get_neo4j_client", lambda: client)
+
+    prerequisites.check_student_can_take("S1", "CS200")
+    prerequisites.check_student_can_take("S2", "CS200")
+
+    assert len(set(client.queries)) == 1
+    assert client.params == [
+        {"student_id": "S1"},
+        {"student_id": "S2"},
+    ]
+
+
+def test_transitive_closure():
+    direct = {"CS300": ["CS200"], "CS200": ["CS100"], "CS100": []}
+
+    closure = prerequisites._transitive_closure(direct)
+
+    assert closure["CS300"] == {"CS200", "CS100"}
+    assert closure["CS100"] == frozenset()
+
+
+def test_transitive_closure_with_cycle():
+    direct = {"A": ["B"], "B": ["A"], "C": ["A"]}
+
+    closure = prerequisites._transitive_closure(direct)
+
+    assert closure["C"] == {"A", "B"}
+
+
+def test_detect_cycles(monkeypatch):
+    direct = {
+        "A": ["B"], "B": ["C"], "C": ["A"],
+        "D": ["D"],
+        "E": ["A"],
+        "F": [],
+    }
+    monkeypatch.setattr(prerequisites, "get_prerequisite_graph", lambda: direct)
+
+    cycles = prerequisites.detect_cycles()
+
+    assert cycles == [
+        {"course": "A", "length": 3, "path": ["A", "B", "C", "A"]},
+        {"course": "D", "length": 1, "path": ["D", "D"]},
+    ]
+    assert len(prerequisites.detect_cycles(limit=1)) == 1
+    assert prerequisites.has_cycles() is True
+
+
+def test_acyclic_graph_has_no_cycles(monkeypatch):
+    direct = {"A": ["B"], "B": ["C"], "C": [], "D": ["B", "C"]}
+    monkeypatch.setattr(prerequisites, "get_prerequisite_graph", lambda: direct)
+
+    assert prerequisites.has_cycles() is False
+    assert prerequisites.detect_cycles() == []
+
+
+def test_prerequisite_graph_is_loaded_with_table(monkeypatch):
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        return {"A": ["B"], "B": []}
+
+    monkeypatch.setattr(prerequisites, "_fetch_direct_prerequisites", fetch)
+    monkeypatch.setattr(prerequisites, "_PREREQ_TABLE", None)
+    monkeypatch.setattr(prerequisites, "_PREREQ_GRAPH", None)
+
+    assert prerequisites.get_prerequisite_graph() == {"A": ["B"], "B": []}
+    assert prerequisites.get_prerequisite_table()["A"] == {"B"}
+    assert prerequisites.detect_cycles() == []
+    assert len(calls) == 1
+
+
+def test_direct_prerequisites_are_streamed(monkeypatch):
+    class StreamingClient:
+        def stream_query(self, query, params=None):
+            yield {"code": "A", "prereqs": ["B"]}
+            yield {"code": "B", "prereqs": []}
+
+    monkeypatch.setattr(prerequisites, "get_neo4j_client", StreamingClient)
+
+    assert prerequisites._fetch_direct_prerequisites() == {"A": ["B"], "B": []}